@@ -259,12 +259,13 @@ class LibraryServiceServicer(LibraryServiceServicer):
             borrowings = self.borrowing_service.get_member_borrowings(request.id)
             borrowing_list = []
             for borrowing in borrowings:
+                # Rows are dictionaries with dates already in ISO format
                 borrowing_list.append(Borrowing(
-                    id=borrowing.id,
-                    book_id=borrowing.book_id,
-                    member_id=borrowing.member_id,
-                    borrow_date=borrowing.borrow_date.isoformat() if borrowing.borrow_date else "",
-                    return_date=borrowing.return_date.isoformat() if borrowing.return_date else ""
+                    id=borrowing['id'],
+                    book_id=borrowing['book_id'],
+                    member_id=borrowing['member_id'],
+                    borrow_date=borrowing['borrow_date'] or "",
+                    return_date=borrowing['return_date'] or ""
                 ))
             return BorrowingList(borrowings=borrowing_list)
         except Exception as e:
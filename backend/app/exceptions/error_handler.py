@@ -15,8 +15,49 @@ from ..utils.logger import LoggerConfig, log_exception
 class ErrorHandler:
     """Centralized error handling with structured logging."""
     
-    def __init__(self, logger_name: str = "error_handler"):
-        self.logger = LoggerConfig.get_logger(logger_name)
+    # Mapping from ErrorCode to HTTP status code
+    ERROR_CODE_TO_HTTP_STATUS = {
+        # Validation errors -> 400 Bad Request
+        ErrorCode.VALIDATION_ERROR: 400,
+        ErrorCode.REQUIRED_FIELD_MISSING: 400,
+        ErrorCode.INVALID_FORMAT: 400,
+        ErrorCode.INVALID_LENGTH: 400,
+        ErrorCode.INVALID_VALUE: 400,
+        
+        # Business logic errors
+        ErrorCode.RESOURCE_NOT_FOUND: 404,
+        ErrorCode.RESOURCE_ALREADY_EXISTS: 409,
+        ErrorCode.BUSINESS_RULE_VIOLATION: 422,
+        ErrorCode.OPERATION_NOT_ALLOWED: 403,
+        ErrorCode.CONFLICT: 409,
+        
+        # Database errors -> 500 Internal Server Error
+        ErrorCode.DATABASE_ERROR: 500,
+        ErrorCode.INTEGRITY_CONSTRAINT_VIOLATION: 500,
+        ErrorCode.CONNECTION_ERROR: 503,
+        ErrorCode.TRANSACTION_ERROR: 500,
+        
+        # Authentication/Authorization errors
+        ErrorCode.UNAUTHORIZED: 401,
+        ErrorCode.FORBIDDEN: 403,
+        ErrorCode.INVALID_CREDENTIALS: 401,
+        
+        # System errors
+        ErrorCode.INTERNAL_ERROR: 500,
+        ErrorCode.SERVICE_UNAVAILABLE: 503,
+        ErrorCode.TIMEOUT: 504,
+        ErrorCode.RATE_LIMIT_EXCEEDED: 429,
+    }
+    
+    def __init__(self, logger_name: str = "error_handler", logger: Optional[logging.Logger] = None):
+        """
+        Initialize the error handler.
+        
+        Args:
+            logger_name: Name of the library logger to use
+            logger: Logger to use instead of looking one up by name
+        """
+        self.logger = logger or LoggerConfig.get_logger(logger_name)
     
     def handle_exception(
         self,
@@ -103,6 +144,10 @@ class ErrorHandler:
         else:
             log_level = logging.WARNING
         
+        # Skip building the message when nothing would emit it
+        if not self.logger.isEnabledFor(log_level):
+            return
+        
         # Log with structured data
         self.logger.log(
             log_level,
@@ -140,15 +185,16 @@ class ErrorHandler:
         grpc_status, details = GRPCStatusMapper.map_exception_to_grpc_status(transformed_exception)
         
         # Log gRPC-specific information
-        self.logger.info(
-            f"gRPC error response: {grpc_status.name} - {details}",
-            extra={
-                "grpc_status": grpc_status.name,
-                "grpc_code": grpc_status.value,
-                "details": details,
-                **log_data
-            }
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"gRPC error response: {grpc_status.name} - {details}",
+                extra={
+                    "grpc_status": grpc_status.name,
+                    "grpc_code": grpc_status.value,
+                    "details": details,
+                    **log_data
+                }
+            )
         
         return transformed_exception, grpc_status, details
     
@@ -186,56 +232,21 @@ class ErrorHandler:
         response_dict["status_code"] = http_status
         
         # Log REST-specific information
-        self.logger.info(
-            f"REST error response: {http_status} - {transformed_exception.message}",
-            extra={
-                "http_status": http_status,
-                "response": response_dict,
-                **log_data
-            }
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"REST error response: {http_status} - {transformed_exception.message}",
+                extra={
+                    "http_status": http_status,
+                    "response": response_dict,
+                    **log_data
+                }
+            )
         
         return transformed_exception, http_status, response_dict
     
     def _map_to_http_status(self, exception: LibraryServiceError) -> int:
         """Map Library Service exception to HTTP status code."""
-        error_code = exception.error_code
-        
-        # Mapping from ErrorCode to HTTP status code
-        error_code_to_http_status = {
-            # Validation errors -> 400 Bad Request
-            ErrorCode.VALIDATION_ERROR: 400,
-            ErrorCode.REQUIRED_FIELD_MISSING: 400,
-            ErrorCode.INVALID_FORMAT: 400,
-            ErrorCode.INVALID_LENGTH: 400,
-            ErrorCode.INVALID_VALUE: 400,
-            
-            # Business logic errors
-            ErrorCode.RESOURCE_NOT_FOUND: 404,
-            ErrorCode.RESOURCE_ALREADY_EXISTS: 409,
-            ErrorCode.BUSINESS_RULE_VIOLATION: 422,
-            ErrorCode.OPERATION_NOT_ALLOWED: 403,
-            ErrorCode.CONFLICT: 409,
-            
-            # Database errors -> 500 Internal Server Error
-            ErrorCode.DATABASE_ERROR: 500,
-            ErrorCode.INTEGRITY_CONSTRAINT_VIOLATION: 500,
-            ErrorCode.CONNECTION_ERROR: 503,
-            ErrorCode.TRANSACTION_ERROR: 500,
-            
-            # Authentication/Authorization errors
-            ErrorCode.UNAUTHORIZED: 401,
-            ErrorCode.FORBIDDEN: 403,
-            ErrorCode.INVALID_CREDENTIALS: 401,
-            
-            # System errors
-            ErrorCode.INTERNAL_ERROR: 500,
-            ErrorCode.SERVICE_UNAVAILABLE: 503,
-            ErrorCode.TIMEOUT: 504,
-            ErrorCode.RATE_LIMIT_EXCEEDED: 429,
-        }
-        
-        return error_code_to_http_status.get(error_code, 500)
+        return self.ERROR_CODE_TO_HTTP_STATUS.get(exception.error_code, 500)
     
     @contextmanager
     def handle_errors(
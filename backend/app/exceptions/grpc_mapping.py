@@ -44,6 +44,42 @@ class GRPCStatusMapper:
         ErrorCode.RATE_LIMIT_EXCEEDED: grpc.StatusCode.RESOURCE_EXHAUSTED,
     }
     
+    # gRPC status codes a client may retry
+    RETRYABLE_STATUSES = frozenset({
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.ABORTED,  # Can be retryable for transient conflicts
+    })
+    
+    # Mapping from ErrorCode to error category; unlisted codes are "system"
+    ERROR_CODE_TO_CATEGORY = {
+        # Validation errors
+        ErrorCode.VALIDATION_ERROR: "validation",
+        ErrorCode.REQUIRED_FIELD_MISSING: "validation",
+        ErrorCode.INVALID_FORMAT: "validation",
+        ErrorCode.INVALID_LENGTH: "validation",
+        ErrorCode.INVALID_VALUE: "validation",
+        
+        # Business logic errors
+        ErrorCode.RESOURCE_NOT_FOUND: "business_logic",
+        ErrorCode.RESOURCE_ALREADY_EXISTS: "business_logic",
+        ErrorCode.BUSINESS_RULE_VIOLATION: "business_logic",
+        ErrorCode.OPERATION_NOT_ALLOWED: "business_logic",
+        ErrorCode.CONFLICT: "business_logic",
+        
+        # Database errors
+        ErrorCode.DATABASE_ERROR: "database",
+        ErrorCode.INTEGRITY_CONSTRAINT_VIOLATION: "database",
+        ErrorCode.CONNECTION_ERROR: "database",
+        ErrorCode.TRANSACTION_ERROR: "database",
+        
+        # Authentication/Authorization errors
+        ErrorCode.UNAUTHORIZED: "authorization",
+        ErrorCode.FORBIDDEN: "authorization",
+        ErrorCode.INVALID_CREDENTIALS: "authorization",
+    }
+    
     @classmethod
     def map_exception_to_grpc_status(
         cls, 
@@ -128,17 +164,8 @@ class GRPCStatusMapper:
         Returns:
             True if the error is retryable, False otherwise
         """
-        grpc_status, _ = cls.map_exception_to_grpc_status(exception)
-        
-        # Retryable status codes
-        retryable_statuses = {
-            grpc.StatusCode.UNAVAILABLE,
-            grpc.StatusCode.DEADLINE_EXCEEDED,
-            grpc.StatusCode.RESOURCE_EXHAUSTED,
-            grpc.StatusCode.ABORTED,  # Can be retryable for transient conflicts
-        }
-        
-        return grpc_status in retryable_statuses
+        # Only the status code matters here, so skip building the details string
+        return cls.get_grpc_status_for_error_code(exception.error_code) in cls.RETRYABLE_STATUSES
     
     @classmethod
     def get_error_category(cls, exception: LibraryServiceError) -> str:
@@ -151,36 +178,4 @@ class GRPCStatusMapper:
         Returns:
             Error category string
         """
-        error_code = exception.error_code
-        
-        if error_code in {
-            ErrorCode.VALIDATION_ERROR,
-            ErrorCode.REQUIRED_FIELD_MISSING,
-            ErrorCode.INVALID_FORMAT,
-            ErrorCode.INVALID_LENGTH,
-            ErrorCode.INVALID_VALUE
-        }:
-            return "validation"
-        elif error_code in {
-            ErrorCode.RESOURCE_NOT_FOUND,
-            ErrorCode.RESOURCE_ALREADY_EXISTS,
-            ErrorCode.BUSINESS_RULE_VIOLATION,
-            ErrorCode.OPERATION_NOT_ALLOWED,
-            ErrorCode.CONFLICT
-        }:
-            return "business_logic"
-        elif error_code in {
-            ErrorCode.DATABASE_ERROR,
-            ErrorCode.INTEGRITY_CONSTRAINT_VIOLATION,
-            ErrorCode.CONNECTION_ERROR,
-            ErrorCode.TRANSACTION_ERROR
-        }:
-            return "database"
-        elif error_code in {
-            ErrorCode.UNAUTHORIZED,
-            ErrorCode.FORBIDDEN,
-            ErrorCode.INVALID_CREDENTIALS
-        }:
-            return "authorization"
-        else:
-            return "system"
+        return cls.ERROR_CODE_TO_CATEGORY.get(exception.error_code, "system")
@@ -2,7 +2,10 @@
 Base service class with common functionality for all services.
 """
 
-from typing import Any, Dict, Optional, Type, TypeVar
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, TypeVar
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from ..infrastructure.database import get_db_session, DatabaseError
 from ..utils.logger import LoggerConfig, log_function_call, log_function_result
@@ -12,6 +15,39 @@ from ..exceptions.error_handler import error_handler
 T = TypeVar('T')
 
 
+def _serialize_value(value, iso_cache: Optional[Dict[Any, str]] = None):
+    """
+    Convert a column value to a JSON-friendly value.
+    
+    Args:
+        value: Column value from a result row
+        iso_cache: Optional per-call map of timestamps already formatted, so
+            rows sharing a timestamp reuse one string. Keys carry the UTC
+            offset because equal aware datetimes in different zones hash alike.
+    """
+    if not hasattr(value, 'isoformat'):  # Only datetime-like values need work
+        return value
+    if iso_cache is None:
+        return value.isoformat()
+    key = (value, value.utcoffset()) if hasattr(value, 'utcoffset') else value
+    iso = iso_cache.get(key)
+    if iso is None:
+        iso = iso_cache[key] = value.isoformat()
+    return iso
+
+
+@lru_cache(maxsize=None)
+def _column_names(model_class) -> Tuple[str, ...]:
+    """Return the model's column names as interned strings, computed once per model."""
+    return tuple(sys.intern(column.name) for column in model_class.__table__.columns)
+
+
+@lru_cache(maxsize=None)
+def _select_columns(model_class):
+    """Return a SELECT of the model's table columns, built once per model."""
+    return select(*model_class.__table__.columns)
+
+
 class BaseService:
     """Base service class with common functionality."""
     
@@ -118,30 +154,44 @@ class BaseService:
         model_class: Type[T], 
         operation: str,
         context: Optional[Dict[str, Any]] = None,
-        filter_condition = None
+        filter_condition = None,
+        extra_columns: Sequence[Any] = ()
     ) -> list[Dict[str, Any]]:
-        """Get all records with error handling."""
+        """
+        Get all records as dictionaries with error handling.
+        
+        Columns are selected directly rather than loading ORM objects, so
+        rows come back as mappings without identity-map overhead.
+        
+        Args:
+            model_class: Model whose table columns are selected
+            operation: Operation name used for logging and errors
+            context: Optional error context
+            filter_condition: Optional WHERE clause
+            extra_columns: Additional labeled SQL expressions to select
+            
+        Returns:
+            One dictionary per row, keyed by column name or label
+        """
         self._log_function_call(operation)
         
         try:
             with get_db_session() as session:
-                query = session.query(model_class)
+                stmt = _select_columns(model_class)
+                if extra_columns:
+                    stmt = stmt.add_columns(*extra_columns)
                 if filter_condition is not None:
-                    query = query.filter(filter_condition)
-                records = query.all()
-                self._log_function_result(operation, f"Found {len(records)} {model_class.__name__} records")
+                    stmt = stmt.where(filter_condition)
+                rows = session.execute(stmt).mappings().all()
+                self._log_function_result(operation, f"Found {len(rows)} {model_class.__name__} records")
                 
-                # Convert SQLAlchemy objects to dictionaries to avoid DetachedInstanceError
-                result = []
-                for record in records:
-                    record_dict = {}
-                    for column in record.__table__.columns:
-                        value = getattr(record, column.name)
-                        if hasattr(value, 'isoformat'):  # Handle datetime objects
-                            record_dict[column.name] = value.isoformat()
-                        else:
-                            record_dict[column.name] = value
-                    result.append(record_dict)
+                column_names = _column_names(model_class) + tuple(column.name for column in extra_columns)
+                # Scoped to this call, so concurrent requests never share it
+                iso_cache = {}
+                result = [
+                    {name: _serialize_value(row[name], iso_cache) for name in column_names}
+                    for row in rows
+                ]
                 
                 return result
         except DatabaseError as e:
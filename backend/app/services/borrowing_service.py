@@ -14,6 +14,10 @@ from ..services.validation_service import validation_service
 from ..utils.validators import ValidationError
 from .base_service import BaseService
 
+# Selected alongside the borrowing columns by the list queries
+_IS_RETURNED = Borrowing.return_date.isnot(None).label('is_returned')
+
+
 class BorrowingService(BaseService):
     """Service for borrowing operations."""
     
@@ -127,9 +131,7 @@ class BorrowingService(BaseService):
             close_session(session)
     
     def get_member_borrowings(self, member_id: int):
-        """Get all borrowings for a member."""
-        log_function_call(self.logger, "get_member_borrowings", member_id=member_id)
-        
+        """Get all borrowings for a member as dictionaries, including is_returned."""
         # Validate member ID
         try:
             validated_id = validation_service.validate_id(member_id, "Member ID")
@@ -137,21 +139,22 @@ class BorrowingService(BaseService):
             log_exception(self.logger, "Member ID validation failed", e, member_id=member_id)
             raise
         
-        session = get_session()
-        try:
-            borrowings = session.query(Borrowing).filter(Borrowing.member_id == validated_id).all()
-            log_function_result(self.logger, "get_member_borrowings", result=f"Retrieved {len(borrowings)} borrowings for member", member_id=validated_id)
-            return borrowings
-        except Exception as e:
-            log_exception(self.logger, "Failed to get member borrowings", e, member_id=validated_id)
-            raise
-        finally:
-            close_session(session)
+        return self._get_all(
+            Borrowing,
+            "get_member_borrowings",
+            context={"member_id": validated_id},
+            filter_condition=Borrowing.member_id == validated_id,
+            extra_columns=(_IS_RETURNED,)
+        )
     
     def get_active_borrowings(self):
         """Get all active (unreturned) borrowings."""
-        from app.models.borrowing import Borrowing
-        return self._get_all(Borrowing, "get_active_borrowings", filter_condition=Borrowing.return_date.is_(None))
+        return self._get_all(
+            Borrowing,
+            "get_active_borrowings",
+            filter_condition=Borrowing.return_date.is_(None),
+            extra_columns=(_IS_RETURNED,)
+        )
     
     def get_borrowing(self, borrowing_id: int) -> Borrowing:
         """Get a borrowing by ID."""
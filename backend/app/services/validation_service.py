@@ -2,7 +2,7 @@
 Validation service for handling data validation and error responses.
 """
 
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 from ..utils.validators import ValidationError as OldValidationError, validation_logger
 from ..exceptions.base import ValidationError
@@ -72,6 +72,27 @@ class ValidationService:
             validation_logger.log_validation_error(OldValidationError(error_message, "data", str(data)), context)
             raise validation_error
     
+    def compile(
+        self,
+        schema_class: Type[BaseModel]
+    ) -> Callable[..., BaseModel]:
+        """
+        Bind a Pydantic schema to a reusable validator function.
+        
+        Args:
+            schema_class: Pydantic schema class
+            
+        Returns:
+            Function taking (data, context=None) and returning the validated model
+        """
+        validate_data = self.validate_data
+        
+        def validator(data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> BaseModel:
+            return validate_data(data, schema_class, context)
+        
+        validator.__name__ = f"validate_{schema_class.__name__}"
+        return validator
+    
     def validate_required_fields(
         self, 
         data: Dict[str, Any], 
@@ -158,8 +179,12 @@ class ValidationService:
             "status_code": status_code
         }
         
-        if error.value is not None:
-            response["value"] = error.value
+        # Legacy validator errors carry value directly; service errors keep it in details
+        value = getattr(error, "value", None)
+        if value is None:
+            value = getattr(error, "details", {}).get("value")
+        if value is not None:
+            response["value"] = value
         
         return response
     
@@ -7,7 +7,7 @@ import logging.handlers
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 class LoggerConfig:
@@ -34,6 +34,13 @@ class LoggerConfig:
     MAX_BYTES = 10 * 1024 * 1024  # 10MB
     BACKUP_COUNT = 5
     
+    # Shared formatters, built once instead of on every setup_logging call
+    _DETAILED_FORMATTER = logging.Formatter(fmt=DEFAULT_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
+    _SIMPLE_FORMATTER = logging.Formatter(fmt='%(levelname)s - %(message)s')
+    
+    # Rotating file handlers keyed by log file path, reused across setup_logging calls
+    _file_handlers: Dict[Path, logging.handlers.RotatingFileHandler] = {}
+    
     @classmethod
     def setup_logging(
         cls,
@@ -65,51 +72,57 @@ class LoggerConfig:
         # Clear any existing handlers
         logger.handlers.clear()
         
-        # Create formatters
-        detailed_formatter = logging.Formatter(
-            fmt=cls.DEFAULT_FORMAT,
-            datefmt=cls.DEFAULT_DATE_FORMAT
-        )
-        
-        simple_formatter = logging.Formatter(
-            fmt='%(levelname)s - %(message)s'
-        )
-        
         # Console handler
         if log_to_console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(level or cls.DEFAULT_LEVEL)
-            console_handler.setFormatter(simple_formatter)
+            console_handler.setFormatter(cls._SIMPLE_FORMATTER)
             logger.addHandler(console_handler)
         
         # File handler for all logs
         if log_to_file:
-            file_handler = logging.handlers.RotatingFileHandler(
-                cls.LOG_FILE,
-                maxBytes=cls.MAX_BYTES,
-                backupCount=cls.BACKUP_COUNT,
-                encoding='utf-8'
-            )
-            file_handler.setLevel(level or cls.DEFAULT_LEVEL)
-            file_handler.setFormatter(detailed_formatter)
-            logger.addHandler(file_handler)
+            # The handler is shared by every logger, so it passes all records
+            # and each logger's own level decides what reaches the file
+            logger.addHandler(cls._get_file_handler(cls.LOG_FILE))
             
             # Separate error log file
-            error_handler = logging.handlers.RotatingFileHandler(
-                cls.ERROR_LOG_FILE,
-                maxBytes=cls.MAX_BYTES,
-                backupCount=cls.BACKUP_COUNT,
-                encoding='utf-8'
-            )
-            error_handler.setLevel(logging.ERROR)
-            error_handler.setFormatter(detailed_formatter)
-            logger.addHandler(error_handler)
+            logger.addHandler(cls._get_file_handler(cls.ERROR_LOG_FILE, logging.ERROR))
         
         # Prevent duplicate logs
         logger.propagate = False
         
         return logger
     
+    @classmethod
+    def _get_file_handler(cls, path: Path, level: int = logging.NOTSET) -> logging.handlers.RotatingFileHandler:
+        """
+        Get the rotating file handler for a log file, creating it on first use.
+        
+        Reusing the handler avoids leaking an open stream every time logging
+        is reconfigured for the same file. The level is applied only when the
+        handler is created, so configuring another logger never changes what
+        loggers already attached to it write.
+        
+        Args:
+            path: Path of the log file
+            level: Handler level, used only when the handler is created
+            
+        Returns:
+            Rotating file handler writing to the given path
+        """
+        handler = cls._file_handlers.get(path)
+        if handler is None:
+            handler = logging.handlers.RotatingFileHandler(
+                path,
+                maxBytes=cls.MAX_BYTES,
+                backupCount=cls.BACKUP_COUNT,
+                encoding='utf-8'
+            )
+            handler.setLevel(level)
+            handler.setFormatter(cls._DETAILED_FORMATTER)
+            cls._file_handlers[path] = handler
+        return handler
+    
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """
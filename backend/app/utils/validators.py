@@ -3,10 +3,20 @@ Validation utilities and custom validators for the Library Service.
 """
 
 import re
+from functools import lru_cache
+from operator import mul
 from typing import Optional, Union
 from email_validator import validate_email, EmailNotValidError
 from ..utils.logger import LoggerConfig, log_exception
 
+# Patterns compiled once at import rather than looked up in re's cache per call
+_ISBN_SEPARATORS_RE = re.compile(r'[-\s]')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
+# The string validators are pure functions of their arguments, so accepted
+# inputs are memoized; rejected inputs raise and are never cached
+_VALIDATOR_CACHE_SIZE = 2048
+
 
 class ValidationError(Exception):
     """Custom validation error with detailed information."""
@@ -18,6 +28,7 @@ class ValidationError(Exception):
         super().__init__(self.message)
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_isbn(isbn: str) -> str:
     """
     Validate ISBN-10 or ISBN-13 format.
@@ -34,8 +45,11 @@ def validate_isbn(isbn: str) -> str:
     if not isbn:
         return isbn
     
-    # Remove hyphens and spaces
-    cleaned_isbn = re.sub(r'[-\s]', '', isbn)
+    # Plain digit strings need no cleaning; only strip hyphens and spaces otherwise
+    if isbn.isdigit() and len(isbn) in (10, 13):
+        cleaned_isbn = isbn
+    else:
+        cleaned_isbn = _ISBN_SEPARATORS_RE.sub('', isbn)
     
     # Check if it's ISBN-10 (10 digits) or ISBN-13 (13 digits)
     if len(cleaned_isbn) == 10:
@@ -91,10 +105,8 @@ def _validate_isbn10_check_digit(isbn: str) -> bool:
     else:
         check_digit = int(last_char)
     
-    # Calculate check digit
-    total = 0
-    for i in range(9):
-        total += int(isbn[i]) * (10 - i)
+    # Weighted sum (10..2) of the first nine digits, computed in C via map/mul
+    total = sum(map(mul, map(int, isbn[:9]), range(10, 1, -1)))
     
     return (total + check_digit) % 11 == 0
 
@@ -104,16 +116,16 @@ def _validate_isbn13_check_digit(isbn: str) -> bool:
     if len(isbn) != 13:
         return False
     
-    # Calculate check digit
-    total = 0
-    for i in range(12):
-        multiplier = 1 if i % 2 == 0 else 3
-        total += int(isbn[i]) * multiplier
+    # Digits in even positions weigh 1, odd positions weigh 3
+    digit_sum = sum(map(int, isbn[:12]))
+    even_sum = sum(map(int, isbn[0:12:2]))
+    total = even_sum + 3 * (digit_sum - even_sum)
     
     check_digit = (10 - (total % 10)) % 10
     return int(isbn[-1]) == check_digit
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_phone(phone: str) -> str:
     """
     Validate phone number format.
@@ -130,8 +142,12 @@ def validate_phone(phone: str) -> str:
     if not phone:
         return phone
     
-    # Remove all non-digit characters except + at the beginning
-    cleaned_phone = re.sub(r'[^\d+]', '', phone)
+    # Remove all non-digit characters except + at the beginning. isdecimal()
+    # matches exactly what \d keeps; isdigit() would also pass '²' and the like
+    if phone.isdecimal():
+        cleaned_phone = phone
+    else:
+        cleaned_phone = _PHONE_STRIP_RE.sub('', phone)
     
     # Check if it starts with + (international format)
     if cleaned_phone.startswith('+'):
@@ -174,9 +190,7 @@ def validate_email_address(email: str) -> str:
         )
     
     try:
-        # Validate email format
-        validated_email = validate_email(email)
-        return validated_email.email
+        return _normalize_email(email)
     except EmailNotValidError as e:
         raise ValidationError(
             f"Invalid email address: {str(e)}",
@@ -185,6 +199,16 @@ def validate_email_address(email: str) -> str:
         )
 
 
+@lru_cache(maxsize=1024)
+def _normalize_email(email: str) -> str:
+    """Validate an email address and return its normalized form.
+    
+    Cached because validation is pure for a given address and may involve a
+    DNS deliverability lookup. Invalid addresses raise and are not cached.
+    """
+    return validate_email(email).email
+
+
 def validate_required_string(value: str, field_name: str, min_length: int = 1, max_length: int = 255) -> str:
     """
     Validate required string field.
@@ -201,6 +225,14 @@ def validate_required_string(value: str, field_name: str, min_length: int = 1, m
     Raises:
         ValidationError: If validation fails
     """
+    # Only strings go through the cache; other values may be unhashable
+    if not isinstance(value, str):
+        return _check_required_string(value, field_name, min_length, max_length)
+    return _check_required_string_cached(value, field_name, min_length, max_length)
+
+
+def _check_required_string(value: str, field_name: str, min_length: int, max_length: int) -> str:
+    """Validate a required string field; see validate_required_string."""
     if not value or not value.strip():
         raise ValidationError(
             f"{field_name} is required and cannot be empty",
@@ -227,6 +259,9 @@ def validate_required_string(value: str, field_name: str, min_length: int = 1, m
     return value
 
 
+_check_required_string_cached = lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)(_check_required_string)
+
+
 def validate_positive_integer(value: int, field_name: str) -> int:
     """
     Validate positive integer field.
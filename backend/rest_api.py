@@ -1,430 +1,603 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
+from werkzeug.exceptions import BadRequest, HTTPException
+import orjson
 import os
 import sys
-
-# Add app to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+import threading
+from collections import OrderedDict
 
 from app.utils.logger import LoggerConfig, log_exception
 from app.schemas.book_schemas import BookCreateSchema, BookUpdateSchema
 from app.schemas.member_schemas import MemberCreateSchema, MemberUpdateSchema
 from app.schemas.borrowing_schemas import BorrowingCreateSchema, BorrowingReturnSchema
 from app.services.validation_service import validation_service
-from app.utils.validators import ValidationError as OldValidationError
+from app.services.book_service import BookService
+from app.services.member_service import MemberService
+from app.services.borrowing_service import BorrowingService
 from app.exceptions.base import ValidationError, LibraryServiceError
 from app.exceptions.error_handler import error_handler
 
+
+class ORJSONResponse(Response):
+    """Flask response class defaulting to JSON bodies."""
+    
+    default_mimetype = 'application/json'
+
+
+# In-process response caches, off unless REST_RESPONSE_CACHE=1. Only REST write
+# handlers invalidate them, so writes made through the gRPC server or another
+# worker process would leave stale bodies; enable them only for a single REST
+# worker that is the sole writer to the database
+_RESPONSE_CACHE_ENABLED = os.environ.get('REST_RESPONSE_CACHE', '0') == '1'
+
+
+class ListResponseCache:
+    """
+    Weak-ETag cache for the serialized body of an idempotent list endpoint.
+    
+    Write handlers call invalidate() to bump the resource version; GET
+    handlers answer If-None-Match with 304 and reuse the last serialized
+    body while its version is still current. Versions live in process
+    memory, so each worker process keeps its own counter and ETags carry a
+    per-process token to keep clients from matching another worker's tags.
+    """
+    
+    _process_token = os.urandom(4).hex()
+    
+    def __init__(self, name: str, max_entries: int = 1):
+        """
+        Initialize the cache.
+        
+        Args:
+            name: Resource name used in ETags
+            max_entries: Number of serialized bodies kept for the current version
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.version = 0
+        self._bodies = {}
+        self._lock = threading.Lock()
+    
+    def etag(self, version: int, key=None) -> str:
+        """Build the (unquoted) weak ETag value for a version and optional key."""
+        tag = f"{self.name}-{self._process_token}-{version}"
+        return tag if key is None else f"{tag}-{key}"
+    
+    def invalidate(self):
+        """Bump the version and drop cached bodies after a write."""
+        with self._lock:
+            self.version += 1
+            self._bodies.clear()
+    
+    def lookup(self, key=None):
+        """
+        Answer the current request from the cache when possible.
+        
+        Args:
+            key: Optional sub-key for parameterized endpoints
+            
+        Returns:
+            Tuple of (version, response); response is None on a cache miss.
+            The version must be read before querying so that a concurrent
+            write can never be hidden behind a stale body.
+        """
+        version = self.version
+        if not _RESPONSE_CACHE_ENABLED:
+            return version, None
+        tag = self.etag(version, key)
+        if request.if_none_match.contains_weak(tag):
+            response = app.response_class(status=304)
+        else:
+            body = self._bodies.get((version, key))
+            if body is None:
+                return version, None
+            response = app.response_class(body, mimetype='application/json')
+        response.set_etag(tag, weak=True)
+        return version, response
+    
+    def store(self, version: int, response, key=None):
+        """
+        Tag a freshly built response and keep its body for later requests.
+        
+        Args:
+            version: Version returned by lookup() before the query ran
+            response: Successful response to cache
+            key: Optional sub-key for parameterized endpoints
+            
+        Returns:
+            The response with its ETag header set
+        """
+        if not _RESPONSE_CACHE_ENABLED:
+            return response
+        with self._lock:
+            if version == self.version:
+                if len(self._bodies) >= self.max_entries:
+                    self._bodies.pop(next(iter(self._bodies)))
+                self._bodies[(version, key)] = response.get_data()
+        response.set_etag(self.etag(version, key), weak=True)
+        return response
+
+
+class ItemResponseCache:
+    """
+    LRU cache of serialized GET-by-id responses for one resource.
+    
+    Write handlers call invalidate() for the item they changed. Every
+    invalidation bumps a generation counter so a body read from the
+    database before a concurrent write is never stored. Writes made
+    outside this process's REST handlers are not seen, so the cache is
+    only active when REST_RESPONSE_CACHE=1.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of serialized bodies kept
+        """
+        self.max_entries = max_entries
+        self.generation = 0
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, item_id: int):
+        """Return the cached response for item_id, or None on a miss."""
+        if not _RESPONSE_CACHE_ENABLED:
+            return None
+        with self._lock:
+            body = self._bodies.get(item_id)
+            if body is None:
+                return None
+            self._bodies.move_to_end(item_id)
+        return app.response_class(body)
+    
+    def put(self, item_id: int, generation: int, response):
+        """
+        Keep a freshly built response body for later requests.
+        
+        Args:
+            item_id: Identifier of the cached item
+            generation: Generation read before the item was loaded
+            response: Successful response to cache
+            
+        Returns:
+            The response unchanged
+        """
+        if not _RESPONSE_CACHE_ENABLED:
+            return response
+        with self._lock:
+            if generation == self.generation:
+                self._bodies[item_id] = response.get_data()
+                self._bodies.move_to_end(item_id)
+                if len(self._bodies) > self.max_entries:
+                    self._bodies.popitem(last=False)
+        return response
+    
+    def invalidate(self, item_id: int):
+        """Drop the cached body for item_id after a write."""
+        with self._lock:
+            self.generation += 1
+            self._bodies.pop(item_id, None)
+    
+    def clear(self):
+        """Drop every cached body."""
+        with self._lock:
+            self.generation += 1
+            self._bodies.clear()
+
+
 app = Flask(__name__)
-CORS(app)
+app.response_class = ORJSONResponse
+# Let browsers cache preflight results for a day instead of re-sending OPTIONS
+CORS(app, max_age=86400)
 
 # Initialize logger for REST API
 logger = LoggerConfig.get_logger("rest_api")
 
+# Shared service instances; services are stateless so one per process suffices
+book_service = BookService()
+member_service = MemberService()
+borrowing_service = BorrowingService()
+
+# Conditional-GET caches for the list endpoints, invalidated by write handlers
+books_cache = ListResponseCache("books")
+members_cache = ListResponseCache("members")
+borrowings_cache = ListResponseCache("borrowings")
+member_borrowings_cache = ListResponseCache("member-borrowings", max_entries=256)
+
+# Read-through caches for the GET-by-id endpoints, invalidated on PUT/DELETE;
+# opt-in like the list caches above
+book_item_cache = ItemResponseCache()
+member_item_cache = ItemResponseCache()
+
+# Validators bound to their schemas once, reused by the write handlers
+_book_create_validator = validation_service.compile(BookCreateSchema)
+_book_update_validator = validation_service.compile(BookUpdateSchema)
+_member_create_validator = validation_service.compile(MemberCreateSchema)
+_member_update_validator = validation_service.compile(MemberUpdateSchema)
+_borrowing_create_validator = validation_service.compile(BorrowingCreateSchema)
+_borrowing_return_validator = validation_service.compile(BorrowingReturnSchema)
+
+
+def ojsonify(obj, status=200):
+    """
+    Serialize obj with orjson and wrap it in a JSON response.
+    
+    datetime values are emitted natively as ISO 8601 strings in the same
+    form as datetime.isoformat(), matching the strings list endpoints get
+    from BaseService._get_all.
+    """
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _book_to_dict(book):
+    """Build the response payload for a book."""
+    return {
+        'id': book.id,
+        'title': book.title,
+        'author': book.author,
+        'isbn': book.isbn,
+        'created_at': book.created_at,
+        'updated_at': book.updated_at
+    }
+
+
+def _member_to_dict(member):
+    """Build the response payload for a member."""
+    return {
+        'id': member.id,
+        'name': member.name,
+        'email': member.email,
+        'phone': member.phone,
+        'created_at': member.created_at,
+        'updated_at': member.updated_at
+    }
+
+
+def _borrowing_to_dict(borrowing):
+    """Build the response payload for a borrowing."""
+    return {
+        'id': borrowing.id,
+        'book_id': borrowing.book_id,
+        'member_id': borrowing.member_id,
+        'borrow_date': borrowing.borrow_date,
+        'return_date': borrowing.return_date,
+        'is_returned': borrowing.return_date is not None
+    }
+
+
+def get_json_body():
+    """
+    Decode the raw request body with orjson.
+    
+    Returns None when the request is not JSON or the body is empty, so
+    handlers answer both with the "No JSON data provided" response.
+    """
+    if not request.is_json:
+        return None
+    body = request.get_data(cache=False)
+    if not body:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise BadRequest(f"Failed to decode JSON object: {e}")
+
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Serialized body shared by list endpoints that find no rows
+_EMPTY_LIST_BODY = b'[]'
+
+# Constant health probe response, serialized once at import
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "Library REST API"})
+_HEALTH_RESP = (_HEALTH_BODY, 200, _JSON_HEADERS)
+
+# Constant error responses, serialized once at import
+_NO_JSON_RESP = (orjson.dumps({"error": "No JSON data provided"}), 400, _JSON_HEADERS)
+_BORROWING_NOT_FOUND_RESP = (orjson.dumps({"error": "Borrowing not found"}), 404, _JSON_HEADERS)
+
+
+@app.errorhandler(ValidationError)
+def _handle_validation_error(e):
+    """Return input validation failures as a 400 validation error response."""
+    logger.warning("%s %s validation failed: %s", request.method, request.path, e.message)
+    return ojsonify(validation_service.create_validation_error_response(e, 400), 400)
+
+
+@app.errorhandler(LibraryServiceError)
+def _handle_library_error(e):
+    """Map library service errors to their HTTP status and error response."""
+    _, http_status, error_response = error_handler.handle_rest_exception(
+        e,
+        context={"endpoint": f"{request.method} {request.path}"},
+        operation=request.endpoint
+    )
+    return ojsonify(error_response, http_status)
+
+
+@app.errorhandler(Exception)
+def _handle_unexpected_error(e):
+    """Serialize errors that escape a handler as a JSON 500 response."""
+    if isinstance(e, HTTPException):
+        return e
+    log_exception(logger, f"Failed to handle {request.method} {request.path}", e)
+    return ojsonify({"error": str(e)}, 500)
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({"status": "healthy", "service": "Library REST API"})
+    return _HEALTH_RESP
 
 # Books endpoints
 @app.route('/books', methods=['GET'])
 def get_books():
     logger.info("GET /books - Retrieving all books")
-    try:
-        from app.services.book_service import BookService
-        book_service = BookService()
-        books = book_service.get_all_books()
-        
-        # Books are now returned as dictionaries from the service
-        logger.info(f"Successfully retrieved {len(books)} books")
-        return jsonify(books)
-    except Exception as e:
-        log_exception(logger, "Failed to retrieve books", e)
-        return jsonify({"error": str(e)}), 500
+    version, cached = books_cache.lookup()
+    if cached is not None:
+        return cached
+    books = book_service.get_all_books()
+    if not books:
+        return books_cache.store(version, app.response_class(_EMPTY_LIST_BODY))
+    
+    # Books are now returned as dictionaries from the service
+    logger.info("Successfully retrieved %s books", len(books))
+    return books_cache.store(version, ojsonify(books))
 
 @app.route('/books/<int:book_id>', methods=['GET'])
 def get_book(book_id):
-    logger.info(f"GET /books/{book_id} - Retrieving book")
-    try:
-        from app.services.book_service import BookService
-        book_service = BookService()
-        book = book_service.get_book(book_id)
-        
-        if not book:
-            logger.warning(f"Book with ID {book_id} not found")
-            return jsonify({"error": "Book not found"}), 404
-        
-        logger.info(f"Successfully retrieved book: {book.title}")
-        return jsonify({
-            'id': book.id,
-            'title': book.title,
-            'author': book.author,
-            'isbn': book.isbn,
-            'created_at': book.created_at.isoformat() if book.created_at else None,
-            'updated_at': book.updated_at.isoformat() if book.updated_at else None
-        })
-    except Exception as e:
-        log_exception(logger, f"Failed to retrieve book {book_id}", e, book_id=book_id)
-        return jsonify({"error": str(e)}), 500
+    logger.info("GET /books/%s - Retrieving book", book_id)
+    cached = book_item_cache.get(book_id)
+    if cached is not None:
+        return cached
+    generation = book_item_cache.generation
+    book = book_service.get_book(book_id)
+    
+    logger.info("Successfully retrieved book: %s", book.title)
+    return book_item_cache.put(book_id, generation, ojsonify(_book_to_dict(book)))
 
 @app.route('/books', methods=['POST'])
 def create_book():
     logger.info("POST /books - Creating new book")
-    try:
-        from app.services.book_service import BookService
-        book_service = BookService()
-        data = request.get_json()
-        
-        if not data:
-            logger.warning("No JSON data provided for book creation")
-            return jsonify({"error": "No JSON data provided"}), 400
-        
-        # Validate input data
-        try:
-            validated_data = validation_service.validate_data(
-                data, 
-                BookCreateSchema,
-                context={"endpoint": "POST /books", "operation": "create_book"}
-            )
-        except LibraryServiceError as e:
-            _, http_status, error_response = error_handler.handle_rest_exception(
-                e,
-                context={"data": data},
-                operation="create_book"
-            )
-            return jsonify(error_response), http_status
-        
-        book = book_service.create_book(
-            title=validated_data.title,
-            author=validated_data.author,
-            isbn=validated_data.isbn
-        )
-        
-        logger.info(f"Successfully created book: {book.title} (ID: {book.id})")
-        return jsonify({
-            'id': book.id,
-            'title': book.title,
-            'author': book.author,
-            'isbn': book.isbn,
-            'created_at': book.created_at.isoformat() if book.created_at else None,
-            'updated_at': book.updated_at.isoformat() if book.updated_at else None
-        }), 201
-    except LibraryServiceError as e:
-        _, http_status, error_response = error_handler.handle_rest_exception(
-            e,
-            context={"data": data},
-            operation="create_book"
-        )
-        return jsonify(error_response), http_status
-    except Exception as e:
-        _, http_status, error_response = error_handler.handle_rest_exception(
-            e,
-            context={"data": data},
-            operation="create_book"
-        )
-        return jsonify(error_response), http_status
+    data = get_json_body()
+    
+    if not data:
+        logger.warning("No JSON data provided for book creation")
+        return _NO_JSON_RESP
+    
+    # Validate input data
+    validated_data = _book_create_validator(
+        data,
+        context={"endpoint": "POST /books", "operation": "create_book"}
+    )
+    
+    book = book_service.create_book(
+        title=validated_data.title,
+        author=validated_data.author,
+        isbn=validated_data.isbn
+    )
+    
+    books_cache.invalidate()
+    logger.info("Successfully created book: %s (ID: %s)", book.title, book.id)
+    return ojsonify(_book_to_dict(book), 201)
 
 @app.route('/books/<int:book_id>', methods=['PUT'])
 def update_book(book_id):
-    logger.info(f"PUT /books/{book_id} - Updating book")
-    try:
-        from app.services.book_service import BookService
-        book_service = BookService()
-        data = request.get_json()
-        
-        if not data:
-            logger.warning("No JSON data provided for book update")
-            return jsonify({"error": "No JSON data provided"}), 400
-        
-        # Validate input data
-        try:
-            validated_data = validation_service.validate_data(
-                data, 
-                BookUpdateSchema,
-                context={"endpoint": f"PUT /books/{book_id}", "operation": "update_book", "book_id": book_id}
-            )
-        except ValidationError as e:
-            error_response = validation_service.create_validation_error_response(e, 400)
-            logger.warning(f"Book update validation failed: {e.message}")
-            return jsonify(error_response), 400
-        
-        book = book_service.update_book(
-            book_id=book_id,
-            title=validated_data.title,
-            author=validated_data.author,
-            isbn=validated_data.isbn
-        )
-        
-        if not book:
-            logger.warning(f"Book with ID {book_id} not found for update")
-            return jsonify({"error": "Book not found"}), 404
-        
-        logger.info(f"Successfully updated book: {book.title} (ID: {book.id})")
-        return jsonify({
-            'id': book.id,
-            'title': book.title,
-            'author': book.author,
-            'isbn': book.isbn,
-            'created_at': book.created_at.isoformat() if book.created_at else None,
-            'updated_at': book.updated_at.isoformat() if book.updated_at else None
-        })
-    except ValidationError as e:
-        error_response = validation_service.create_validation_error_response(e, 400)
-        logger.warning(f"Book update validation failed: {e.message}")
-        return jsonify(error_response), 400
-    except Exception as e:
-        log_exception(logger, f"Failed to update book {book_id}", e, book_id=book_id, data=data)
-        return jsonify({"error": str(e)}), 500
+    logger.info("PUT /books/%s - Updating book", book_id)
+    data = get_json_body()
+    
+    if not data:
+        logger.warning("No JSON data provided for book update")
+        return _NO_JSON_RESP
+    
+    # Validate input data
+    validated_data = _book_update_validator(
+        data,
+        context={"endpoint": f"PUT /books/{book_id}", "operation": "update_book", "book_id": book_id}
+    )
+    
+    book = book_service.update_book(
+        book_id=book_id,
+        title=validated_data.title,
+        author=validated_data.author,
+        isbn=validated_data.isbn
+    )
+    
+    books_cache.invalidate()
+    book_item_cache.invalidate(book_id)
+    logger.info("Successfully updated book: %s (ID: %s)", book.title, book.id)
+    return ojsonify(_book_to_dict(book))
 
 @app.route('/books/<int:book_id>', methods=['DELETE'])
 def delete_book(book_id):
-    try:
-        from app.services.book_service import BookService
-        book_service = BookService()
-        success = book_service.delete_book(book_id)
-        
-        if not success:
-            return jsonify({"error": "Book not found"}), 404
-        
-        return jsonify({"message": "Book deleted successfully"}), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    book_service.delete_book(book_id)
+    
+    books_cache.invalidate()
+    book_item_cache.invalidate(book_id)
+    return ojsonify({"message": "Book deleted successfully"}, 200)
 
 # Members endpoints
 @app.route('/members', methods=['GET'])
 def get_members():
-    try:
-        from app.services.member_service import MemberService
-        member_service = MemberService()
-        members = member_service.get_all_members()
-        
-        # Members are now returned as dictionaries from the service
-        return jsonify(members)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    version, cached = members_cache.lookup()
+    if cached is not None:
+        return cached
+    members = member_service.get_all_members()
+    if not members:
+        return members_cache.store(version, app.response_class(_EMPTY_LIST_BODY))
+    
+    # Members are now returned as dictionaries from the service
+    return members_cache.store(version, ojsonify(members))
 
 @app.route('/members/<int:member_id>', methods=['GET'])
 def get_member(member_id):
-    try:
-        from app.services.member_service import MemberService
-        member_service = MemberService()
-        member = member_service.get_member(member_id)
-        
-        if not member:
-            return jsonify({"error": "Member not found"}), 404
-        
-        return jsonify({
-            'id': member.id,
-            'name': member.name,
-            'email': member.email,
-            'phone': member.phone,
-            'created_at': member.created_at.isoformat() if member.created_at else None,
-            'updated_at': member.updated_at.isoformat() if member.updated_at else None
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    cached = member_item_cache.get(member_id)
+    if cached is not None:
+        return cached
+    generation = member_item_cache.generation
+    member = member_service.get_member(member_id)
+    
+    return member_item_cache.put(member_id, generation, ojsonify(_member_to_dict(member)))
 
 @app.route('/members', methods=['POST'])
 def create_member():
     logger.info("POST /members - Creating new member")
-    try:
-        from app.services.member_service import MemberService
-        member_service = MemberService()
-        data = request.get_json()
-        
-        if not data:
-            logger.warning("No JSON data provided for member creation")
-            return jsonify({"error": "No JSON data provided"}), 400
-        
-        # Validate input data
-        try:
-            validated_data = validation_service.validate_data(
-                data, 
-                MemberCreateSchema,
-                context={"endpoint": "POST /members", "operation": "create_member"}
-            )
-        except ValidationError as e:
-            error_response = validation_service.create_validation_error_response(e, 400)
-            logger.warning(f"Member creation validation failed: {e.message}")
-            return jsonify(error_response), 400
-        
-        member = member_service.create_member(
-            name=validated_data.name,
-            email=validated_data.email,
-            phone=validated_data.phone
-        )
-        
-        logger.info(f"Successfully created member: {member.name} (ID: {member.id})")
-        return jsonify({
-            'id': member.id,
-            'name': member.name,
-            'email': member.email,
-            'phone': member.phone,
-            'created_at': member.created_at.isoformat() if member.created_at else None,
-            'updated_at': member.updated_at.isoformat() if member.updated_at else None
-        }), 201
-    except ValidationError as e:
-        error_response = validation_service.create_validation_error_response(e, 400)
-        logger.warning(f"Member creation validation failed: {e.message}")
-        return jsonify(error_response), 400
-    except Exception as e:
-        log_exception(logger, "Failed to create member", e, data=data)
-        return jsonify({"error": str(e)}), 500
+    data = get_json_body()
+    
+    if not data:
+        logger.warning("No JSON data provided for member creation")
+        return _NO_JSON_RESP
+    
+    # Validate input data
+    validated_data = _member_create_validator(
+        data,
+        context={"endpoint": "POST /members", "operation": "create_member"}
+    )
+    
+    member = member_service.create_member(
+        name=validated_data.name,
+        email=validated_data.email,
+        phone=validated_data.phone
+    )
+    
+    members_cache.invalidate()
+    logger.info("Successfully created member: %s (ID: %s)", member.name, member.id)
+    return ojsonify(_member_to_dict(member), 201)
 
 @app.route('/members/<int:member_id>', methods=['PUT'])
 def update_member(member_id):
-    try:
-        from app.services.member_service import MemberService
-        member_service = MemberService()
-        data = request.get_json()
-        member = member_service.update_member(
-            member_id=member_id,
-            name=data.get('name'),
-            email=data.get('email'),
-            phone=data.get('phone')
-        )
-        
-        if not member:
-            return jsonify({"error": "Member not found"}), 404
-        
-        return jsonify({
-            'id': member.id,
-            'name': member.name,
-            'email': member.email,
-            'phone': member.phone,
-            'created_at': member.created_at.isoformat() if member.created_at else None,
-            'updated_at': member.updated_at.isoformat() if member.updated_at else None
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    data = get_json_body()
+    
+    if not data:
+        logger.warning("No JSON data provided for member update")
+        return _NO_JSON_RESP
+    
+    # Validate input data
+    validated_data = _member_update_validator(
+        data,
+        context={"endpoint": f"PUT /members/{member_id}", "operation": "update_member", "member_id": member_id}
+    )
+    
+    member = member_service.update_member(
+        member_id=member_id,
+        name=validated_data.name,
+        email=validated_data.email,
+        phone=validated_data.phone
+    )
+    
+    members_cache.invalidate()
+    member_item_cache.invalidate(member_id)
+    return ojsonify(_member_to_dict(member))
 
 @app.route('/members/<int:member_id>', methods=['DELETE'])
 def delete_member(member_id):
-    try:
-        from app.services.member_service import MemberService
-        member_service = MemberService()
-        success = member_service.delete_member(member_id)
-        
-        if not success:
-            return jsonify({"error": "Member not found"}), 404
-        
-        return jsonify({"message": "Member deleted successfully"}), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    member_service.delete_member(member_id)
+    
+    members_cache.invalidate()
+    member_item_cache.invalidate(member_id)
+    return ojsonify({"message": "Member deleted successfully"}, 200)
 
 # Borrowings endpoints
 @app.route('/borrowings', methods=['GET'])
 def get_borrowings():
-    try:
-        from app.services.borrowing_service import BorrowingService
-        borrowing_service = BorrowingService()
-        borrowings = borrowing_service.get_active_borrowings()
-        
-        # Borrowings are now returned as dictionaries from the service
-        # Add computed field for is_returned
-        for borrowing in borrowings:
-            borrowing['is_returned'] = borrowing.get('return_date') is not None
-        
-        return jsonify(borrowings)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    version, cached = borrowings_cache.lookup()
+    if cached is not None:
+        return cached
+    borrowings = borrowing_service.get_active_borrowings()
+    if not borrowings:
+        return borrowings_cache.store(version, app.response_class(_EMPTY_LIST_BODY))
+    
+    # Borrowings are returned as dictionaries, including is_returned
+    return borrowings_cache.store(version, ojsonify(borrowings))
 
 @app.route('/borrowings', methods=['POST'])
 def borrow_book():
     logger.info("POST /borrowings - Borrowing book")
+    data = get_json_body()
+    
+    if not data:
+        logger.warning("No JSON data provided for book borrowing")
+        return _NO_JSON_RESP
+    
+    # Validate input data
+    validated_data = _borrowing_create_validator(
+        data,
+        context={"endpoint": "POST /borrowings", "operation": "borrow_book"}
+    )
+    
     try:
-        from app.services.borrowing_service import BorrowingService
-        borrowing_service = BorrowingService()
-        data = request.get_json()
-        
-        if not data:
-            logger.warning("No JSON data provided for book borrowing")
-            return jsonify({"error": "No JSON data provided"}), 400
-        
-        # Validate input data
-        try:
-            validated_data = validation_service.validate_data(
-                data, 
-                BorrowingCreateSchema,
-                context={"endpoint": "POST /borrowings", "operation": "borrow_book"}
-            )
-        except ValidationError as e:
-            error_response = validation_service.create_validation_error_response(e, 400)
-            logger.warning(f"Book borrowing validation failed: {e.message}")
-            return jsonify(error_response), 400
-        
         borrowing = borrowing_service.borrow_book(
             book_id=validated_data.book_id,
             member_id=validated_data.member_id
         )
-        
-        logger.info(f"Successfully borrowed book {borrowing.book_id} by member {borrowing.member_id}")
-        return jsonify({
-            'id': borrowing.id,
-            'book_id': borrowing.book_id,
-            'member_id': borrowing.member_id,
-            'borrow_date': borrowing.borrow_date.isoformat() if borrowing.borrow_date else None,
-            'return_date': borrowing.return_date.isoformat() if borrowing.return_date else None,
-            'is_returned': borrowing.return_date is not None
-        }), 201
-    except ValidationError as e:
-        error_response = validation_service.create_validation_error_response(e, 400)
-        logger.warning(f"Book borrowing validation failed: {e.message}")
-        return jsonify(error_response), 400
     except ValueError as e:
-        logger.warning(f"Business logic error in book borrowing: {str(e)}")
-        return jsonify({"error": str(e)}), 400
-    except Exception as e:
-        log_exception(logger, "Failed to borrow book", e, data=data)
-        return jsonify({"error": str(e)}), 500
+        logger.warning("Business logic error in book borrowing: %s", e)
+        return ojsonify({"error": str(e)}, 400)
+    
+    borrowings_cache.invalidate()
+    member_borrowings_cache.invalidate()
+    logger.info("Successfully borrowed book %s by member %s", borrowing.book_id, borrowing.member_id)
+    return ojsonify(_borrowing_to_dict(borrowing), 201)
 
 @app.route('/borrowings/return', methods=['POST'])
 def return_book():
-    try:
-        from app.services.borrowing_service import BorrowingService
-        borrowing_service = BorrowingService()
-        data = request.get_json()
-        borrowing = borrowing_service.return_book(
-            book_id=data.get('book_id'),
-            member_id=data.get('member_id')
-        )
-        
-        if not borrowing:
-            return jsonify({"error": "Borrowing not found"}), 404
-        
-        return jsonify({
-            'id': borrowing.id,
-            'book_id': borrowing.book_id,
-            'member_id': borrowing.member_id,
-            'borrow_date': borrowing.borrow_date.isoformat() if borrowing.borrow_date else None,
-            'return_date': borrowing.return_date.isoformat() if borrowing.return_date else None,
-            'is_returned': borrowing.return_date is not None
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    data = get_json_body()
+    
+    if not data:
+        logger.warning("No JSON data provided for book return")
+        return _NO_JSON_RESP
+    
+    # Validate input data
+    validated_data = _borrowing_return_validator(
+        data,
+        context={"endpoint": "POST /borrowings/return", "operation": "return_book"}
+    )
+    
+    borrowing = borrowing_service.return_book(
+        book_id=validated_data.book_id,
+        member_id=validated_data.member_id
+    )
+    
+    if not borrowing:
+        return _BORROWING_NOT_FOUND_RESP
+    
+    borrowings_cache.invalidate()
+    member_borrowings_cache.invalidate()
+    return ojsonify(_borrowing_to_dict(borrowing))
 
 @app.route('/borrowings/member/<int:member_id>', methods=['GET'])
 def get_member_borrowings(member_id):
-    try:
-        from app.services.borrowing_service import BorrowingService
-        borrowing_service = BorrowingService()
-        borrowings = borrowing_service.get_member_borrowings(member_id)
-        
-        borrowing_list = []
-        for borrowing in borrowings:
-            borrowing_list.append({
-                'id': borrowing.id,
-                'book_id': borrowing.book_id,
-                'member_id': borrowing.member_id,
-                'borrow_date': borrowing.borrow_date.isoformat() if borrowing.borrow_date else None,
-                'return_date': borrowing.return_date.isoformat() if borrowing.return_date else None,
-                'is_returned': borrowing.return_date is not None
-            })
-        
-        return jsonify(borrowing_list)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    version, cached = member_borrowings_cache.lookup(member_id)
+    if cached is not None:
+        return cached
+    borrowings = borrowing_service.get_member_borrowings(member_id)
+    if not borrowings:
+        return member_borrowings_cache.store(version, app.response_class(_EMPTY_LIST_BODY), member_id)
+    
+    # Borrowings are returned as dictionaries, including is_returned
+    return member_borrowings_cache.store(version, ojsonify(borrowings), member_id)
+
+def create_app() -> Flask:
+    """
+    Return the configured Flask application for WSGI servers.
+    
+    Run in production with, from the backend directory:
+    gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:$REST_PORT 'rest_api:create_app()'
+    """
+    return app
+
 
 if __name__ == '__main__':
-    port = int(os.environ.get('REST_PORT', 8000))
-    logger.info(f"Starting Library REST API on port {port}...")
-    app.run(host='0.0.0.0', port=port, debug=False) 
\ No newline at end of file
+    if os.environ.get('FLASK_DEV') == '1':
+        port = int(os.environ.get('REST_PORT', 8000))
+        logger.info("Starting Library REST API development server on port %s...", port)
+        app.run(host='0.0.0.0', port=port, debug=False)
+    else:
+        logger.error("Serve the REST API with a WSGI server (see create_app), or set FLASK_DEV=1 for the development server")
+        sys.exit(1)
@@ -7,25 +7,40 @@ import sys
 import os
 import subprocess
 import argparse
+import importlib.util
+import shlex
 
-def run_command(command, description):
-    """Run a command and handle errors."""
+def run_command(command, description, log_file=None):
+    """
+    Run a command (argv list) and handle errors, streaming its output live.
+    
+    When log_file is given, combined stdout/stderr is also copied to that
+    file line by line, so memory use stays constant however long the run.
+    """
     print(f"\n{'='*60}")
     print(f"Running: {description}")
-    print(f"Command: {command}")
-    print(f"{'='*60}")
+    print(f"Command: {shlex.join(command)}")
+    print(f"{'='*60}", flush=True)
+    
+    if log_file is None:
+        returncode = subprocess.run(command).returncode
+    else:
+        with open(log_file, "w") as log, subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True
+        ) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                log.write(line)
+        returncode = proc.returncode
     
-    try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+    if returncode != 0:
+        print(f"Error running command: exit status {returncode}")
         return False
+    return True
 
 def main():
     """Main test runner."""
@@ -36,6 +51,11 @@ def main():
     parser.add_argument("--coverage", action="store_true", help="Generate coverage report")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--no-cov", action="store_true", help="Disable coverage reporting")
+    parser.add_argument("--log-file", help="Also write test output to this file")
+    parser.add_argument("--parallel", "-p", default="auto",
+                        help="Number of pytest-xdist workers ('auto' for one per core, '0' to run serially)")
+    parser.add_argument("--max-unit-duration", type=float, default=None,
+                        help="Fail if a unit test takes longer than this many seconds (off by default; meant for CI)")
     
     args = parser.parse_args()
     
@@ -43,26 +63,43 @@ def main():
     backend_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(backend_dir)
     
-    # Build pytest command
-    pytest_cmd = "python -m pytest"
+    # Build pytest command. The suite has no doctests and the runner offers no
+    # --lf/--ff, so skip those plugins' hooks and the .pytest_cache writes
+    pytest_cmd = [
+        sys.executable, "-m", "pytest",
+        "-p", "no:doctest",
+        "-p", "no:cacheprovider",
+        "--import-mode=importlib",
+        "--durations=10",
+    ]
     
     if args.unit:
-        pytest_cmd += " tests/unit/"
+        pytest_cmd.append("tests/unit/")
     elif args.integration:
-        pytest_cmd += " tests/integration/"
+        pytest_cmd.append("tests/integration/")
     elif args.validation:
-        pytest_cmd += " -m validation"
+        pytest_cmd += ["-m", "validation"]
     else:
-        pytest_cmd += " tests/"
+        pytest_cmd.append("tests/")
     
     if args.verbose:
-        pytest_cmd += " -v"
+        pytest_cmd.append("-v")
+    
+    if args.max_unit_duration:
+        pytest_cmd.append(f"--max-unit-duration={args.max_unit_duration}")
+    
+    if args.parallel != "0":
+        if importlib.util.find_spec("xdist") is not None:
+            # loadgroup keeps tests sharing an xdist_group on the same worker
+            pytest_cmd += ["-n", args.parallel, "--dist", "loadgroup"]
+        else:
+            print("pytest-xdist is not installed; running tests serially")
     
     if not args.no_cov and args.coverage:
-        pytest_cmd += " --cov=app --cov-report=html --cov-report=term-missing"
+        pytest_cmd += ["--cov=app", "--cov-report=html", "--cov-report=term-missing"]
     
     # Run tests
-    success = run_command(pytest_cmd, "Running tests")
+    success = run_command(pytest_cmd, "Running tests", log_file=args.log_file)
     
     if success:
         print(f"\n{'='*60}")
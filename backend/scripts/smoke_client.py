@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Smoke-test client for the Library Service.
+
+Run from the backend directory against a running gRPC server:
+
+    python -m scripts.smoke_client
+"""
+
+import asyncio
+import grpc
+import grpc.aio
+
+from app.api import library_pb2, library_pb2_grpc
+from app.utils.logger import LoggerConfig, log_exception
+
+# Request templates built once and copied per call
+_BOOK_TEMPLATE = library_pb2.Book(
+    title="The Great Gatsby",
+    author="F. Scott Fitzgerald",
+    isbn="978-0743273565"
+)
+_MEMBER_TEMPLATE = library_pb2.Member(
+    name="John Doe",
+    email="john@example.com",
+    phone="555-1234"
+)
+_EMPTY_REQUEST = library_pb2.Empty()
+
+async def run_library_checks(stub):
+    """
+    Exercise the library service through an async stub.
+    
+    Independent calls are issued concurrently so they share the channel's
+    HTTP/2 connection instead of paying one round trip each.
+    
+    Args:
+        stub: LibraryService stub bound to a grpc.aio channel
+    """
+    logger = LoggerConfig.get_logger("smoke_client")
+    logger.info("Testing Library Service...")
+    logger.info("=" * 50)
+    
+    try:
+        # Tests 1-2: Create a book and a member concurrently
+        logger.info("Tests 1-2: Creating a book and a member...")
+        book_request = library_pb2.Book()
+        book_request.CopyFrom(_BOOK_TEMPLATE)
+        member_request = library_pb2.Member()
+        member_request.CopyFrom(_MEMBER_TEMPLATE)
+        book_response, member_response = await asyncio.gather(
+            stub.CreateBook(book_request),
+            stub.CreateMember(member_request)
+        )
+        logger.info(f"Book created with ID: {book_response.id}")
+        logger.info(f"Member created with ID: {member_response.id}")
+        
+        # Test 3: Get the book
+        logger.info("Test 3: Getting the book...")
+        book_id_request = library_pb2.BookId(id=book_response.id)
+        book = await stub.GetBook(book_id_request)
+        logger.info(f"Book retrieved: {book.title} by {book.author}")
+        
+        # Test 4: List all books
+        logger.info("Test 4: Listing all books...")
+        books = await stub.ListBooks(_EMPTY_REQUEST)
+        logger.info(f"Found {len(books.books)} books:")
+        for book in books.books:
+            logger.info(f"   - {book.title} by {book.author}")
+        
+        # Test 5: Borrow the book
+        logger.info("Test 5: Borrowing the book...")
+        borrow_request = library_pb2.BorrowRequest(
+            member_id=member_response.id,
+            book_id=book_response.id
+        )
+        borrowing = await stub.BorrowBook(borrow_request)
+        logger.info("Book borrowed successfully!")
+        
+        logger.info("All tests passed! Service is working correctly.")
+        
+    except grpc.RpcError as e:
+        logger.error(f"gRPC Error: {e.code()}: {e.details()}")
+    except Exception as e:
+        log_exception(logger, "Test failed with error", e)
+
+
+async def _run_on_channel(target):
+    """Run the checks on a fresh async channel to ``target``."""
+    async with grpc.aio.insecure_channel(target) as channel:
+        await run_library_checks(library_pb2_grpc.LibraryServiceStub(channel))
+
+
+def smoke_test_library_service(target='localhost:50051'):
+    """
+    Smoke-test the library service.
+    
+    The grpc.aio channel is opened inside the event loop that runs the
+    checks, since aio channels cannot be shared across loops.
+    
+    Args:
+        target: Address of the gRPC server to check
+    """
+    asyncio.run(_run_on_channel(target))
+
+if __name__ == "__main__":
+    smoke_test_library_service()
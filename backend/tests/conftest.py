@@ -2,53 +2,113 @@
 Pytest configuration and fixtures for the Library Service tests.
 """
 
+import itertools
+import logging
 import os
+import re
+from functools import lru_cache
 import sys
+import orjson
 import pytest
 from unittest.mock import Mock, patch
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from faker import Faker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.pool import StaticPool
 
 # Add the app directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
 
 from app.models.base import Base
+from app.models.book import Book
+from app.models.member import Member
+from app.models.borrowing import Borrowing
 from app.infrastructure.database import get_db_session, DatabaseError
 from app.utils.logger import LoggerConfig
 
-# Initialize faker for test data generation
-fake = Faker()
+# Faker is created lazily: building it loads many provider modules, which
+# every xdist worker would otherwise pay at conftest import
+_fake = None
 
-# Test database URL (in-memory SQLite for testing)
+
+def _get_fake():
+    """Return the shared, deterministically seeded Faker instance."""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+        _fake.seed_instance(0)
+    return _fake
+
+# Tests never configure SQLAlchemy logging, so drop its records at the
+# logger instead of letting each one walk the handler hierarchy
+logging.getLogger("sqlalchemy").disabled = True
+
+# Test database URL (in-memory SQLite for testing). Each pytest-xdist worker
+# is a separate process, so every worker gets its own private database.
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
-# Create test engine
-test_engine = create_engine(TEST_DATABASE_URL, echo=False)
-TestSessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=False)
+@pytest.fixture(scope="session")
+def test_engine():
+    """Provide one test engine for the whole session.
+    
+    StaticPool hands out a single connection so every session sees the
+    same in-memory database.
+    """
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINT rollback works with pysqlite
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture(scope="session")
-def setup_test_db():
-    """Set up test database tables."""
+def setup_test_db(test_engine):
+    """Set up test database tables once per session (per xdist worker).
+    
+    No teardown is needed: the in-memory database is discarded when the
+    engine is disposed.
+    """
     Base.metadata.create_all(test_engine)
-    yield
-    Base.metadata.drop_all(test_engine)
 
 
 @pytest.fixture
-def db_session(setup_test_db):
-    """Provide a database session for testing."""
-    session = TestSessionLocal()
+def db_session(test_engine, setup_test_db):
+    """Provide a database session whose changes are rolled back after the test.
+    
+    The session runs inside an outer transaction and turns its own commits
+    into SAVEPOINTs, so tables are created once and each test starts clean.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
 def mock_db_session():
-    """Provide a mocked database session."""
+    """Provide a mocked database session.
+    
+    This is the session ``mock_get_db_session`` yields from ``__enter__``,
+    so tests can configure it directly.
+    """
     session = Mock()
     session.add = Mock()
     session.commit = Mock()
@@ -60,6 +120,107 @@ def mock_db_session():
     return session
 
 
+@pytest.fixture(scope="session")
+def query_chain_factory():
+    """Provide a builder for mocked ``session.query(...)`` results.
+    
+    ``make_chain(first_return)`` returns a Query spec mock whose
+    ``filter(...).first()`` yields ``first_return``.
+    """
+    def make_chain(first_return=None):
+        query = Mock(spec=Query)
+        query.configure_mock(**{"filter.return_value.first.return_value": first_return})
+        return query
+    
+    return make_chain
+
+
+@pytest.fixture(scope="session")
+def query_stub():
+    """Provide a helper that stubs ``session.query(...).filter(...).first()``.
+    
+    ``stub(session, value)`` makes ``first()`` return ``value``;
+    ``stub(session, *values)`` with several values returns them in turn.
+    The stubbed ``filter(...)`` result is returned.
+    """
+    def stub(session, *values):
+        query = session.query.return_value.filter.return_value
+        if len(values) == 1:
+            query.first.return_value = values[0]
+        else:
+            query.first.side_effect = values
+        return query
+    
+    return stub
+
+
+@lru_cache(maxsize=None)
+def _spec_names(model):
+    """Return the attribute names of ``model`` for use as a Mock spec.
+    
+    ``Mock(spec=cls)`` re-runs ``dir(cls)`` and probes every attribute on
+    each construction; a precomputed name list restricts attribute access
+    the same way without repeating that scan.
+    """
+    return tuple(dir(model))
+
+
+@pytest.fixture(scope="session")
+def mock_model_factory():
+    """Provide a builder for model spec mocks.
+    
+    ``make(model, **attrs)`` returns a Mock limited to ``model``'s
+    attributes, for both reads and writes, with ``attrs`` configured on it.
+    """
+    def make(model, **attrs):
+        mock = Mock(spec_set=_spec_names(model))
+        if attrs:
+            mock.configure_mock(**attrs)
+        return mock
+    
+    return make
+
+
+@pytest.fixture
+def mock_book(mock_model_factory):
+    """Provide a fresh Book spec mock."""
+    return mock_model_factory(Book)
+
+
+@pytest.fixture
+def mock_member(mock_model_factory):
+    """Provide a fresh Member spec mock."""
+    return mock_model_factory(Member)
+
+
+@pytest.fixture
+def mock_borrowing(mock_model_factory):
+    """Provide a fresh Borrowing spec mock."""
+    return mock_model_factory(Borrowing)
+
+
+@pytest.fixture(scope="session")
+def mock_book_factory(mock_model_factory):
+    """Provide a builder for Book spec mocks.
+    
+    ``make_book(**overrides)`` returns a Book spec mock populated with
+    the default test book, with ``overrides`` applied on top.
+    """
+    defaults = {
+        "id": 1,
+        "title": "Test Book",
+        "author": "Test Author",
+        "isbn": "9780743273565",
+        "created_at": None,
+        "updated_at": None,
+    }
+    
+    def make_book(**overrides):
+        return mock_model_factory(Book, **{**defaults, **overrides})
+    
+    return make_book
+
+
 @pytest.fixture
 def mock_get_db_session(mock_db_session):
     """Mock the get_db_session context manager."""
@@ -69,6 +230,19 @@ def mock_get_db_session(mock_db_session):
         yield mock
 
 
+@pytest.fixture
+def mock_session(monkeypatch, mock_get_db_session, mock_db_session):
+    """Provide the mocked database session wired into the service modules.
+    
+    Services bind their session helpers at import time, so besides the
+    ``get_db_session`` patch this points ``base_service.get_db_session`` and
+    ``borrowing_service.get_session`` at the same mocked session.
+    """
+    monkeypatch.setattr("app.services.base_service.get_db_session", mock_get_db_session)
+    monkeypatch.setattr("app.services.borrowing_service.get_session", lambda: mock_db_session)
+    return mock_db_session
+
+
 @pytest.fixture
 def mock_logger():
     """Mock logger for testing."""
@@ -90,67 +264,163 @@ def mock_validation_service():
         yield mock
 
 
+@pytest.fixture(scope="session")
+def book_service():
+    """Provide a BookService shared across the session; services hold no per-test state."""
+    from app.services.book_service import BookService
+    return BookService()
+
+
+@pytest.fixture(scope="session")
+def member_service():
+    """Provide a MemberService shared across the session."""
+    from app.services.member_service import MemberService
+    return MemberService()
+
+
+@pytest.fixture(scope="session")
+def borrowing_service():
+    """Provide a BorrowingService shared across the session."""
+    from app.services.borrowing_service import BorrowingService
+    return BorrowingService()
+
+
+@pytest.fixture(scope="session")
+def validation_service():
+    """Provide a real ValidationService shared across the session."""
+    from app.services.validation_service import ValidationService
+    return ValidationService()
+
+
+@pytest.fixture(scope="session")
+def null_logger():
+    """Provide a disabled logger that discards everything sent to it."""
+    logger = logging.getLogger("test_handler_null")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.disabled = True
+    return logger
+
+
+@pytest.fixture(scope="session")
+def error_handler(null_logger):
+    """Provide an ErrorHandler shared across the session, logging nowhere."""
+    from app.exceptions.error_handler import ErrorHandler
+    return ErrorHandler("test_handler", logger=null_logger)
+
+
+# Static request payloads shared by the data fixtures and their serialized forms
+SAMPLE_BOOK_DATA = {
+    "title": "The Great Gatsby",
+    "author": "F. Scott Fitzgerald",
+    "isbn": "978-0743273565"
+}
+
+SAMPLE_MEMBER_DATA = {
+    "name": "John Doe",
+    "email": "john.doe@example.com",
+    "phone": "+1-555-123-4567"
+}
+
+SAMPLE_BORROWING_DATA = {
+    "book_id": 1,
+    "member_id": 1
+}
+
+INVALID_BOOK_DATA = {
+    "title": "",  # Empty title
+    "author": "Test Author",
+    "isbn": "invalid-isbn"
+}
+
+INVALID_MEMBER_DATA = {
+    "name": "",  # Empty name
+    "email": "invalid-email",  # Invalid email
+    "phone": "123"  # Invalid phone
+}
+
+INVALID_BORROWING_DATA = {
+    "book_id": 0,  # Invalid ID
+    "member_id": -1  # Invalid ID
+}
+
+
 @pytest.fixture
 def sample_book_data():
     """Sample book data for testing."""
-    return {
-        "title": "The Great Gatsby",
-        "author": "F. Scott Fitzgerald",
-        "isbn": "978-0743273565"
-    }
+    return dict(SAMPLE_BOOK_DATA)
 
 
 @pytest.fixture
 def sample_member_data():
     """Sample member data for testing."""
-    return {
-        "name": "John Doe",
-        "email": "john.doe@example.com",
-        "phone": "+1-555-123-4567"
-    }
+    return dict(SAMPLE_MEMBER_DATA)
 
 
 @pytest.fixture
 def sample_borrowing_data():
     """Sample borrowing data for testing."""
-    return {
-        "book_id": 1,
-        "member_id": 1
-    }
+    return dict(SAMPLE_BORROWING_DATA)
 
 
 @pytest.fixture
 def invalid_book_data():
     """Invalid book data for testing validation."""
-    return {
-        "title": "",  # Empty title
-        "author": "Test Author",
-        "isbn": "invalid-isbn"
-    }
+    return dict(INVALID_BOOK_DATA)
 
 
 @pytest.fixture
 def invalid_member_data():
     """Invalid member data for testing validation."""
-    return {
-        "name": "",  # Empty name
-        "email": "invalid-email",  # Invalid email
-        "phone": "123"  # Invalid phone
-    }
+    return dict(INVALID_MEMBER_DATA)
 
 
 @pytest.fixture
 def invalid_borrowing_data():
     """Invalid borrowing data for testing validation."""
-    return {
-        "book_id": 0,  # Invalid ID
-        "member_id": -1  # Invalid ID
-    }
+    return dict(INVALID_BORROWING_DATA)
 
 
-@pytest.fixture
+# Request bodies serialized once per session for tests that only POST them
+@pytest.fixture(scope="session")
+def sample_book_json():
+    """Serialized sample book data."""
+    return orjson.dumps(SAMPLE_BOOK_DATA)
+
+
+@pytest.fixture(scope="session")
+def sample_member_json():
+    """Serialized sample member data."""
+    return orjson.dumps(SAMPLE_MEMBER_DATA)
+
+
+@pytest.fixture(scope="session")
+def sample_borrowing_json():
+    """Serialized sample borrowing data."""
+    return orjson.dumps(SAMPLE_BORROWING_DATA)
+
+
+@pytest.fixture(scope="session")
+def invalid_book_json():
+    """Serialized invalid book data."""
+    return orjson.dumps(INVALID_BOOK_DATA)
+
+
+@pytest.fixture(scope="session")
+def invalid_member_json():
+    """Serialized invalid member data."""
+    return orjson.dumps(INVALID_MEMBER_DATA)
+
+
+@pytest.fixture(scope="session")
+def invalid_borrowing_json():
+    """Serialized invalid borrowing data."""
+    return orjson.dumps(INVALID_BORROWING_DATA)
+
+
+@pytest.fixture(scope="session")
 def mock_flask_app():
-    """Mock Flask app for testing."""
+    """Mock Flask app for testing, shared across the session."""
     from flask import Flask
     app = Flask(__name__)
     app.config['TESTING'] = True
@@ -179,7 +449,63 @@ def setup_logging():
 @pytest.fixture
 def faker_instance():
     """Provide a faker instance for generating test data."""
-    return fake
+    return _get_fake()
+
+
+# Faker output generated on first use and cycled through by TestDataFactory
+_DATA_POOL_SIZE = 256
+
+
+def _isbn13(n):
+    """Build a valid ISBN-13 with a 978 prefix from a sequence number."""
+    digits = f"978{n:09d}"
+    check = (10 - sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(digits)) % 10) % 10
+    return f"{digits}{check}"
+
+
+# Valid, unique ISBN-13s computed once instead of asking Faker per payload
+_ISBNS = tuple(_isbn13(i) for i in range(_DATA_POOL_SIZE))
+
+
+@lru_cache(maxsize=None)
+def _book_cycle():
+    """Return a cycle over pre-generated book payloads."""
+    fake = _get_fake()
+    return itertools.cycle([
+        {
+            "title": fake.sentence(nb_words=3).rstrip('.'),
+            "author": fake.name(),
+            "isbn": isbn
+        }
+        for isbn in _ISBNS
+    ])
+
+
+@lru_cache(maxsize=None)
+def _member_cycle():
+    """Return a cycle over pre-generated member payloads."""
+    fake = _get_fake()
+    return itertools.cycle([
+        {
+            "name": fake.name(),
+            "email": fake.email(),
+            "phone": fake.phone_number()
+        }
+        for _ in range(_DATA_POOL_SIZE)
+    ])
+
+
+@lru_cache(maxsize=None)
+def _borrowing_cycle():
+    """Return a cycle over pre-generated borrowing payloads."""
+    fake = _get_fake()
+    return itertools.cycle([
+        {
+            "book_id": fake.random_int(min=1, max=100),
+            "member_id": fake.random_int(min=1, max=100)
+        }
+        for _ in range(_DATA_POOL_SIZE)
+    ])
 
 
 class TestDataFactory:
@@ -188,28 +514,17 @@ class TestDataFactory:
     @staticmethod
     def create_book_data(**kwargs):
         """Create book test data."""
-        return {
-            "title": kwargs.get("title", fake.sentence(nb_words=3).rstrip('.')),
-            "author": kwargs.get("author", fake.name()),
-            "isbn": kwargs.get("isbn", fake.isbn13())
-        }
+        return {**next(_book_cycle()), **kwargs}
     
     @staticmethod
     def create_member_data(**kwargs):
         """Create member test data."""
-        return {
-            "name": kwargs.get("name", fake.name()),
-            "email": kwargs.get("email", fake.email()),
-            "phone": kwargs.get("phone", fake.phone_number())
-        }
+        return {**next(_member_cycle()), **kwargs}
     
     @staticmethod
     def create_borrowing_data(**kwargs):
         """Create borrowing test data."""
-        return {
-            "book_id": kwargs.get("book_id", fake.random_int(min=1, max=100)),
-            "member_id": kwargs.get("member_id", fake.random_int(min=1, max=100))
-        }
+        return {**next(_borrowing_cycle()), **kwargs}
 
 
 @pytest.fixture
@@ -219,6 +534,17 @@ def test_data_factory():
 
 
 # Pytest configuration
+def pytest_addoption(parser):
+    """Register the slow unit test gate option."""
+    parser.addoption(
+        "--max-unit-duration",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Fail the run if any unit test's call phase takes longer than SECONDS",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest."""
     config.addinivalue_line(
@@ -233,20 +559,49 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "database: mark test as database test"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a group on one xdist worker"
+    )
+
+
+# Test directories whose name is applied as a marker to the tests under them
+_MARKER_RE = re.compile(r"tests/(?P<kind>unit|integration|validation|database)/")
 
 
 def pytest_collection_modifyitems(config, items):
-    """Modify test collection to add markers."""
+    """Modify test collection to add markers, resolving each file once."""
+    markers_by_file = {}
     for item in items:
-        # Add unit marker to tests in unit directory
-        if "unit" in item.nodeid:
-            item.add_marker(pytest.mark.unit)
-        # Add integration marker to tests in integration directory
-        elif "integration" in item.nodeid:
-            item.add_marker(pytest.mark.integration)
-        # Add validation marker to validation tests
-        elif "validation" in item.nodeid:
-            item.add_marker(pytest.mark.validation)
-        # Add database marker to database tests
-        elif "database" in item.nodeid:
-            item.add_marker(pytest.mark.database)
+        path = item.nodeid.split("::", 1)[0]
+        if path not in markers_by_file:
+            match = _MARKER_RE.search(path)
+            markers_by_file[path] = getattr(pytest.mark, match.group("kind")) if match else None
+        mark = markers_by_file[path]
+        if mark is not None:
+            item.add_marker(mark)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Fail an otherwise passing run when unit tests exceed --max-unit-duration."""
+    limit = session.config.getoption("--max-unit-duration")
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if not limit or reporter is None:
+        return
+    
+    slow = [
+        report
+        for reports in reporter.stats.values()
+        for report in reports
+        if getattr(report, "when", None) == "call"
+        and "unit" in report.keywords
+        and report.duration > limit
+    ]
+    if not slow:
+        return
+    
+    reporter.write_line("")
+    reporter.write_sep("=", f"unit tests slower than {limit:.3f}s", red=True)
+    for report in sorted(slow, key=lambda r: r.duration, reverse=True):
+        reporter.write_line(f"{report.duration:.3f}s {report.nodeid}")
+    if exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
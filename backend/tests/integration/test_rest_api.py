@@ -4,6 +4,8 @@ Integration tests for REST API endpoints.
 
 import pytest
 import json
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import patch, Mock
 from flask import Flask
 
@@ -12,57 +14,71 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'app'))
 
+import rest_api
 from rest_api import app
+from app.schemas.book_schemas import BookResponseSchema
+from app.schemas.member_schemas import MemberResponseSchema
+from app.schemas.borrowing_schemas import BorrowingResponseSchema
+from app.services.base_service import _serialize_value
 
+# The Flask app and its response caches are module-level state; keep these
+# tests on a single xdist worker
+pytestmark = pytest.mark.xdist_group("rest_api")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the Flask app."""
+    """Create one test client for the Flask app, shared across tests."""
     app.config['TESTING'] = True
-    with app.test_client() as client:
-        yield client
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def reset_response_caches():
+    """Start every test with empty REST response caches."""
+    for cache in (rest_api.books_cache, rest_api.members_cache,
+                  rest_api.borrowings_cache, rest_api.member_borrowings_cache):
+        cache.invalidate()
+    rest_api.book_item_cache.clear()
+    rest_api.member_item_cache.clear()
+
+
+@pytest.fixture
+def enable_response_cache(monkeypatch):
+    """Turn on the opt-in REST response caches for one test."""
+    monkeypatch.setattr(rest_api, '_RESPONSE_CACHE_ENABLED', True)
 
 
 class TestBooksAPI:
     """Test books REST API endpoints."""
     
-    def test_get_books_success(self, client, mock_get_db_session):
+    def test_get_books_success(self, client, mock_session):
         """Test successful GET /books."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
-        mock_book = Mock()
-        mock_book.id = 1
-        mock_book.title = "Test Book"
-        mock_book.author = "Test Author"
-        mock_book.isbn = "9780743273565"
-        mock_book.created_at = None
-        mock_book.updated_at = None
-        mock_session.query.return_value.all.return_value = [mock_book]
+        created_at = datetime(2024, 1, 2, 3, 4, 5)
+        mock_session.execute.return_value.mappings.return_value.all.return_value = [
+            {"id": 1, "title": "Test Book", "author": "Test Author", "isbn": "9780743273565",
+             "created_at": created_at, "updated_at": None},
+        ]
         
         # Execute
         response = client.get('/books')
         
         # Verify
         assert response.status_code == 200
-        data = json.loads(response.data)
-        assert len(data) == 1
-        assert data[0]['title'] == "Test Book"
-        assert data[0]['author'] == "Test Author"
-        assert data[0]['isbn'] == "9780743273565"
+        assert json.loads(response.data) == [
+            {"id": 1, "title": "Test Book", "author": "Test Author", "isbn": "9780743273565",
+             "created_at": "2024-01-02T03:04:05", "updated_at": None},
+        ]
+        mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
     
-    def test_get_book_success(self, client, mock_get_db_session, mock_validation_service):
+    def test_get_book_success(self, client, mock_session, mock_validation_service, query_chain_factory, mock_book_factory):
         """Test successful GET /books/<id>."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_id.return_value = 1
-        mock_book = Mock()
-        mock_book.id = 1
-        mock_book.title = "Test Book"
-        mock_book.author = "Test Author"
-        mock_book.isbn = "9780743273565"
-        mock_book.created_at = None
-        mock_book.updated_at = None
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_book
+        mock_book = mock_book_factory()
+        mock_session.query.return_value = query_chain_factory(mock_book)
         
         # Execute
         response = client.get('/books/1')
@@ -74,12 +90,11 @@ class TestBooksAPI:
         assert data['author'] == "Test Author"
         assert data['isbn'] == "9780743273565"
     
-    def test_get_book_not_found(self, client, mock_get_db_session, mock_validation_service):
+    def test_get_book_not_found(self, client, mock_session, mock_validation_service, query_chain_factory):
         """Test GET /books/<id> when book not found."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_id.return_value = 1
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        mock_session.query.return_value = query_chain_factory(None)
         
         # Execute
         response = client.get('/books/1')
@@ -87,31 +102,24 @@ class TestBooksAPI:
         # Verify
         assert response.status_code == 404
         data = json.loads(response.data)
-        assert data['error'] == "Book not found"
+        assert data['error'] == "BookNotFoundError"
+        assert data['message'] == "Book with ID 1 not found"
     
-    def test_create_book_success(self, client, mock_get_db_session, mock_validation_service, sample_book_data):
+    def test_create_book_success(self, client, mock_session, mock_validation_service, sample_book_json):
         """Test successful POST /books."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_data.return_value = Mock(
             title="The Great Gatsby",
             author="F. Scott Fitzgerald",
             isbn="9780743273565"
         )
-        mock_book = Mock()
-        mock_book.id = 1
-        mock_book.title = "The Great Gatsby"
-        mock_book.author = "F. Scott Fitzgerald"
-        mock_book.isbn = "9780743273565"
-        mock_book.created_at = None
-        mock_book.updated_at = None
         mock_session.add.return_value = None
         mock_session.flush.return_value = None
         mock_session.refresh.return_value = None
         
         # Execute
         response = client.post('/books', 
-                             data=json.dumps(sample_book_data),
+                             data=sample_book_json,
                              content_type='application/json')
         
         # Verify
@@ -121,14 +129,14 @@ class TestBooksAPI:
         assert data['author'] == "F. Scott Fitzgerald"
         assert data['isbn'] == "9780743273565"
     
-    def test_create_book_validation_error(self, client, mock_validation_service, invalid_book_data):
+    def test_create_book_validation_error(self, client, mock_validation_service, invalid_book_json):
         """Test POST /books with validation error."""
         # Setup
         mock_validation_service.validate_data.side_effect = ValidationError("Invalid data", "title", "")
         
         # Execute
         response = client.post('/books',
-                             data=json.dumps(invalid_book_data),
+                             data=invalid_book_json,
                              content_type='application/json')
         
         # Verify
@@ -147,24 +155,29 @@ class TestBooksAPI:
         data = json.loads(response.data)
         assert data['error'] == "No JSON data provided"
     
-    def test_update_book_success(self, client, mock_get_db_session, mock_validation_service):
+    def test_create_book_non_json_content_type(self, client, sample_book_json):
+        """Test POST /books with a JSON body sent under a non-JSON content type."""
+        # Execute
+        response = client.post('/books',
+                             data=sample_book_json,
+                             content_type='text/plain')
+        
+        # Verify
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['error'] == "No JSON data provided"
+    
+    def test_update_book_success(self, client, mock_session, mock_validation_service, query_chain_factory, mock_book_factory):
         """Test successful PUT /books/<id>."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_id.return_value = 1
         mock_validation_service.validate_data.return_value = Mock(
             title="Updated Title",
             author="Updated Author",
             isbn="9780743273565"
         )
-        mock_book = Mock()
-        mock_book.id = 1
-        mock_book.title = "Updated Title"
-        mock_book.author = "Updated Author"
-        mock_book.isbn = "9780743273565"
-        mock_book.created_at = None
-        mock_book.updated_at = None
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_book
+        mock_book = mock_book_factory(title="Updated Title", author="Updated Author")
+        mock_session.query.return_value = query_chain_factory(mock_book)
         mock_session.flush.return_value = None
         mock_session.refresh.return_value = None
         
@@ -186,17 +199,16 @@ class TestBooksAPI:
         assert data['author'] == "Updated Author"
         assert data['isbn'] == "9780743273565"
     
-    def test_update_book_not_found(self, client, mock_get_db_session, mock_validation_service):
+    def test_update_book_not_found(self, client, mock_session, mock_validation_service, query_chain_factory):
         """Test PUT /books/<id> when book not found."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_id.return_value = 1
         mock_validation_service.validate_data.return_value = Mock(
             title="Updated Title",
             author="Updated Author",
             isbn="9780743273565"
         )
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        mock_session.query.return_value = query_chain_factory(None)
         
         update_data = {
             "title": "Updated Title",
@@ -212,16 +224,15 @@ class TestBooksAPI:
         # Verify
         assert response.status_code == 404
         data = json.loads(response.data)
-        assert data['error'] == "Book not found"
+        assert data['error'] == "BookNotFoundError"
+        assert data['message'] == "Book with ID 1 not found"
     
-    def test_delete_book_success(self, client, mock_get_db_session, mock_validation_service):
+    def test_delete_book_success(self, client, mock_session, mock_validation_service, query_chain_factory, mock_book_factory):
         """Test successful DELETE /books/<id>."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_id.return_value = 1
-        mock_book = Mock()
-        mock_book.title = "Test Book"
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_book
+        mock_book = mock_book_factory()
+        mock_session.query.return_value = query_chain_factory(mock_book)
         mock_session.delete.return_value = None
         mock_session.flush.return_value = None
         
@@ -233,12 +244,11 @@ class TestBooksAPI:
         data = json.loads(response.data)
         assert data['message'] == "Book deleted successfully"
     
-    def test_delete_book_not_found(self, client, mock_get_db_session, mock_validation_service):
+    def test_delete_book_not_found(self, client, mock_session, mock_validation_service, query_chain_factory):
         """Test DELETE /books/<id> when book not found."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_id.return_value = 1
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        mock_session.query.return_value = query_chain_factory(None)
         
         # Execute
         response = client.delete('/books/1')
@@ -246,16 +256,16 @@ class TestBooksAPI:
         # Verify
         assert response.status_code == 404
         data = json.loads(response.data)
-        assert data['error'] == "Book not found"
+        assert data['error'] == "BookNotFoundError"
+        assert data['message'] == "Book with ID 1 not found"
 
 
 class TestMembersAPI:
     """Test members REST API endpoints."""
     
-    def test_create_member_success(self, client, mock_get_db_session, mock_validation_service, sample_member_data):
+    def test_create_member_success(self, client, mock_session, mock_validation_service, sample_member_json):
         """Test successful POST /members."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_data.return_value = Mock(
             name="John Doe",
             email="john.doe@example.com",
@@ -274,7 +284,7 @@ class TestMembersAPI:
         
         # Execute
         response = client.post('/members',
-                             data=json.dumps(sample_member_data),
+                             data=sample_member_json,
                              content_type='application/json')
         
         # Verify
@@ -284,14 +294,14 @@ class TestMembersAPI:
         assert data['email'] == "john.doe@example.com"
         assert data['phone'] == "+15551234567"
     
-    def test_create_member_validation_error(self, client, mock_validation_service, invalid_member_data):
+    def test_create_member_validation_error(self, client, mock_validation_service, invalid_member_json):
         """Test POST /members with validation error."""
         # Setup
         mock_validation_service.validate_data.side_effect = ValidationError("Invalid email", "email", "invalid")
         
         # Execute
         response = client.post('/members',
-                             data=json.dumps(invalid_member_data),
+                             data=invalid_member_json,
                              content_type='application/json')
         
         # Verify
@@ -304,10 +314,9 @@ class TestMembersAPI:
 class TestBorrowingsAPI:
     """Test borrowings REST API endpoints."""
     
-    def test_borrow_book_success(self, client, mock_get_db_session, mock_validation_service, sample_borrowing_data):
+    def test_borrow_book_success(self, client, mock_session, mock_validation_service, sample_borrowing_json):
         """Test successful POST /borrowings."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_data.return_value = Mock(book_id=1, member_id=1)
         
         # Mock book and member existence
@@ -327,7 +336,7 @@ class TestBorrowingsAPI:
         
         # Execute
         response = client.post('/borrowings',
-                             data=json.dumps(sample_borrowing_data),
+                             data=sample_borrowing_json,
                              content_type='application/json')
         
         # Verify
@@ -337,14 +346,14 @@ class TestBorrowingsAPI:
         assert data['member_id'] == 1
         assert data['is_returned'] is False
     
-    def test_borrow_book_validation_error(self, client, mock_validation_service, invalid_borrowing_data):
+    def test_borrow_book_validation_error(self, client, mock_validation_service, invalid_borrowing_json):
         """Test POST /borrowings with validation error."""
         # Setup
         mock_validation_service.validate_data.side_effect = ValidationError("Invalid ID", "book_id", 0)
         
         # Execute
         response = client.post('/borrowings',
-                             data=json.dumps(invalid_borrowing_data),
+                             data=invalid_borrowing_json,
                              content_type='application/json')
         
         # Verify
@@ -353,12 +362,11 @@ class TestBorrowingsAPI:
         assert data['error'] == "Validation Error"
         assert "Invalid ID" in data['message']
     
-    def test_borrow_book_business_logic_error(self, client, mock_get_db_session, mock_validation_service):
+    def test_borrow_book_business_logic_error(self, client, mock_session, mock_validation_service, query_chain_factory):
         """Test POST /borrowings with business logic error."""
         # Setup
-        mock_session = mock_get_db_session.return_value.__enter__.return_value
         mock_validation_service.validate_data.return_value = Mock(book_id=1, member_id=1)
-        mock_session.query.return_value.filter.return_value.first.return_value = None  # Book not found
+        mock_session.query.return_value = query_chain_factory(None)  # Book not found
         
         borrowing_data = {"book_id": 1, "member_id": 1}
         
@@ -373,6 +381,102 @@ class TestBorrowingsAPI:
         assert "Book not found" in data['error']
 
 
+class TestResponsePayloads:
+    """Test response payload helpers against the response schemas."""
+    
+    @pytest.mark.parametrize("to_dict, schema_class, obj", [
+        (rest_api._book_to_dict, BookResponseSchema,
+         Mock(id=1, title="Test Book", author="Test Author", isbn=None,
+              created_at=None, updated_at=None)),
+        (rest_api._member_to_dict, MemberResponseSchema,
+         SimpleNamespace(id=1, name="Test Member", email="test@example.com", phone=None,
+                         created_at=None, updated_at=None)),
+        (rest_api._borrowing_to_dict, BorrowingResponseSchema,
+         Mock(id=1, book_id=1, member_id=1, borrow_date=None, return_date=None)),
+    ])
+    def test_payload_matches_response_schema(self, to_dict, schema_class, obj):
+        """Test each payload helper emits exactly the response schema fields."""
+        payload = to_dict(obj)
+        
+        assert list(payload) == list(schema_class.model_fields)
+        assert schema_class.model_validate(payload).model_dump() == payload
+    
+    def test_member_borrowings_use_list_format(self, client, mock_session):
+        """Test member borrowings come from the column-select path with list-format dates."""
+        borrow_date = datetime(2024, 1, 2, 3, 4, 5)
+        mock_session.execute.return_value.mappings.return_value.all.return_value = [
+            {"id": 1, "book_id": 1, "member_id": 1, "borrow_date": borrow_date,
+             "return_date": None, "is_returned": False},
+        ]
+        response = client.get('/borrowings/member/1')
+        
+        assert response.status_code == 200
+        assert json.loads(response.data) == [
+            {"id": 1, "book_id": 1, "member_id": 1, "borrow_date": _serialize_value(borrow_date),
+             "return_date": None, "is_returned": False},
+        ]
+        assert _serialize_value(borrow_date) == "2024-01-02T03:04:05"
+        mock_session.query.assert_not_called()
+
+
+class TestErrorResponses:
+    """Test shared REST error responses."""
+    
+    def test_unhandled_error_returns_json_500(self, client):
+        """Test exceptions escaping a handler are returned as JSON."""
+        with patch.object(rest_api.book_service, 'delete_book', side_effect=RuntimeError("boom")):
+            response = client.delete('/books/1')
+        
+        assert response.status_code == 500
+        assert json.loads(response.data) == {"error": "boom"}
+    
+    def test_validation_error_returns_400(self, client):
+        """Test schema validation failures are returned by the shared handler."""
+        response = client.post('/books', json={"title": "", "author": "Test Author"})
+        
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['error'] == "Validation Error"
+        assert "title" in data['message']
+    
+    def test_http_errors_pass_through(self, client):
+        """Test HTTP errors keep their own status codes."""
+        response = client.get('/no-such-route')
+        
+        assert response.status_code == 404
+
+
+class TestCORS:
+    """Test CORS preflight handling."""
+    
+    def test_preflight_is_cacheable(self, client):
+        """Test preflight responses let browsers cache them for a day."""
+        response = client.options('/books', headers={
+            'Origin': 'http://localhost:3000',
+            'Access-Control-Request-Method': 'POST'
+        })
+        
+        assert response.status_code == 200
+        assert response.headers['Access-Control-Max-Age'] == '86400'
+
+
+class TestRouteRegistration:
+    """Test the REST API route table."""
+    
+    def test_each_route_registered_once(self):
+        """Test every rule/method pair maps to exactly one endpoint."""
+        seen = set()
+        for rule in app.url_map.iter_rules():
+            for method in rule.methods - {'HEAD', 'OPTIONS'}:
+                key = (rule.rule, method)
+                assert key not in seen, f"Duplicate route: {method} {rule.rule}"
+                seen.add(key)
+        
+        assert ('/members/<int:member_id>', 'PUT') in seen
+        assert ('/borrowings/return', 'POST') in seen
+        assert ('/borrowings/member/<int:member_id>', 'GET') in seen
+
+
 class TestHealthEndpoint:
     """Test health check endpoint."""
     
@@ -384,3 +488,82 @@ class TestHealthEndpoint:
         data = json.loads(response.data)
         assert data['status'] == "healthy"
         assert data['service'] == "Library REST API"
+
+
+
+class TestListResponseCache:
+    """Test conditional GET handling for list endpoints."""
+    
+    def test_list_cache_disabled_by_default(self, client):
+        """Test GET /books queries the service every time unless caching is enabled."""
+        with patch.object(rest_api.book_service, 'get_all_books', return_value=[]) as mock_get_all:
+            response = client.get('/books')
+            client.get('/books')
+        
+        assert 'ETag' not in response.headers
+        assert mock_get_all.call_count == 2
+    
+    @pytest.mark.usefixtures("enable_response_cache")
+    def test_get_books_sets_etag_and_returns_304(self, client):
+        """Test GET /books returns an ETag and honours If-None-Match."""
+        books = [{"id": 1, "title": "Test Book"}]
+        with patch.object(rest_api.book_service, 'get_all_books', return_value=books) as mock_get_all:
+            response = client.get('/books')
+            etag = response.headers['ETag']
+            
+            assert response.status_code == 200
+            assert etag.startswith('W/"books-')
+            
+            not_modified = client.get('/books', headers={'If-None-Match': etag})
+            cached = client.get('/books')
+        
+        assert not_modified.status_code == 304
+        assert not_modified.data == b''
+        assert cached.status_code == 200
+        assert json.loads(cached.data) == books
+        mock_get_all.assert_called_once()
+    
+    @pytest.mark.usefixtures("enable_response_cache")
+    def test_write_invalidates_cached_list(self, client):
+        """Test a successful delete bumps the books ETag."""
+        with patch.object(rest_api.book_service, 'get_all_books', return_value=[]) as mock_get_all, \
+             patch.object(rest_api.book_service, 'delete_book', return_value=True):
+            etag = client.get('/books').headers['ETag']
+            client.delete('/books/1')
+            response = client.get('/books', headers={'If-None-Match': etag})
+        
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert mock_get_all.call_count == 2
+    
+    def test_item_cache_disabled_by_default(self, client):
+        """Test GET /books/<id> and /members/<id> load fresh data unless caching is enabled."""
+        book = Mock(id=1, title="Test Book", author="Test Author", isbn="9780743273565",
+                    created_at=None, updated_at=None)
+        member = Mock(id=1, email="john@example.com", phone=None, created_at=None, updated_at=None)
+        member.name = "John Doe"
+        with patch.object(rest_api.book_service, 'get_book', return_value=book) as mock_get_book, \
+             patch.object(rest_api.member_service, 'get_member', return_value=member) as mock_get_member:
+            client.get('/books/1')
+            client.get('/books/1')
+            client.get('/members/1')
+            client.get('/members/1')
+        
+        assert mock_get_book.call_count == 2
+        assert mock_get_member.call_count == 2
+    
+    @pytest.mark.usefixtures("enable_response_cache")
+    def test_get_book_read_through_cache(self, client):
+        """Test GET /books/<id> is served from cache until the book is updated."""
+        book = Mock(id=1, title="Test Book", author="Test Author", isbn="9780743273565",
+                    created_at=None, updated_at=None)
+        with patch.object(rest_api.book_service, 'get_book', return_value=book) as mock_get, \
+             patch.object(rest_api.book_service, 'update_book', return_value=book):
+            first = client.get('/books/1')
+            second = client.get('/books/1')
+            client.put('/books/1', json={"title": "Test Book"})
+            third = client.get('/books/1')
+        
+        assert first.data == second.data
+        assert json.loads(third.data)['title'] == "Test Book"
+        assert mock_get.call_count == 2
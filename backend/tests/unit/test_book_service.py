@@ -0,0 +1,186 @@
+"""
+Unit tests for the book service.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.utils.validators import ValidationError
+from app.infrastructure.database import DatabaseError
+from app.models.book import Book
+
+
+class TestBookService:
+    """Test book service functionality."""
+    
+    def test_create_book_success(self, book_service, mock_session, mock_validation_service, sample_book_data, mock_book):
+        """Test successful book creation."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(
+            title="The Great Gatsby",
+            author="F. Scott Fitzgerald",
+            isbn="9780743273565"
+        )
+        mock_book.id = 1
+        
+        # Execute
+        result = book_service.create_book("The Great Gatsby", "F. Scott Fitzgerald", "978-0743273565")
+        
+        # Verify
+        mock_validation_service.validate_data.assert_called_once()
+        mock_session.add.assert_called_once()
+        mock_session.flush.assert_called_once()
+        mock_session.refresh.assert_called_once()
+    
+    def test_create_book_database_error(self, book_service, mock_get_db_session, mock_validation_service):
+        """Test book creation with database error."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(
+            title="Test Book",
+            author="Test Author",
+            isbn="9780743273565"
+        )
+        mock_get_db_session.side_effect = DatabaseError("Database error", None, "create_book")
+        
+        # Execute & Verify
+        with pytest.raises(DatabaseError):
+            book_service.create_book("Test Book", "Test Author", "978-0743273565")
+    
+    def test_get_book_success(self, book_service, mock_session, query_stub, mock_validation_service, mock_book):
+        """Test successful book retrieval."""
+        # Setup
+        mock_validation_service.validate_id.return_value = 1
+        mock_book.title = "Test Book"
+        query_stub(mock_session, mock_book)
+        
+        # Execute
+        result = book_service.get_book(1)
+        
+        # Verify
+        mock_validation_service.validate_id.assert_called_once_with(1, "Book ID")
+        mock_session.query.assert_called_once_with(Book)
+        assert result == mock_book
+    
+    def test_get_book_not_found(self, book_service, mock_session, query_stub, mock_validation_service):
+        """Test book retrieval when book not found."""
+        # Setup
+        mock_validation_service.validate_id.return_value = 1
+        query_stub(mock_session, None)
+        
+        # Execute
+        result = book_service.get_book(1)
+        
+        # Verify
+        assert result is None
+    
+    def test_get_book_invalid_id(self, book_service, mock_validation_service):
+        """Test book retrieval with invalid ID."""
+        # Setup
+        mock_validation_service.validate_id.side_effect = ValidationError("Invalid ID", "id", 0)
+        
+        # Execute & Verify
+        with pytest.raises(ValidationError):
+            book_service.get_book(0)
+    
+    def test_get_all_books_success(self, book_service, mock_session):
+        """Test successful retrieval of all books."""
+        # Setup
+        mock_rows = [
+            {"id": 1, "title": "Book One", "author": "Author", "isbn": None,
+             "created_at": None, "updated_at": None},
+            {"id": 2, "title": "Book Two", "author": "Author", "isbn": None,
+             "created_at": None, "updated_at": None}
+        ]
+        mock_session.execute.return_value.mappings.return_value.all.return_value = mock_rows
+        
+        # Execute
+        result = book_service.get_all_books()
+        
+        # Verify
+        mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
+        assert result == mock_rows
+    
+    def test_get_all_books_keeps_timestamp_offsets(self, book_service, mock_session):
+        """Test equal timestamps in different zones keep their own offsets."""
+        # Setup
+        utc_time = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        cet_time = datetime(2024, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+        mock_session.execute.return_value.mappings.return_value.all.return_value = [
+            {"id": 1, "title": "Book One", "author": "Author", "isbn": None,
+             "created_at": utc_time, "updated_at": cet_time},
+        ]
+        
+        # Execute
+        result = book_service.get_all_books()
+        
+        # Verify
+        assert result[0]["created_at"] == "2024-01-01T12:00:00+00:00"
+        assert result[0]["updated_at"] == "2024-01-01T13:00:00+01:00"
+    
+    def test_update_book_success(self, book_service, mock_session, query_stub, mock_validation_service, mock_book):
+        """Test successful book update."""
+        # Setup
+        mock_validation_service.validate_id.return_value = 1
+        mock_validation_service.validate_data.return_value = SimpleNamespace(
+            title="Updated Title",
+            author="Updated Author",
+            isbn="9780743273565"
+        )
+        mock_book.title = "Updated Title"
+        query_stub(mock_session, mock_book)
+        
+        # Execute
+        result = book_service.update_book(1, "Updated Title", "Updated Author", "978-0743273565")
+        
+        # Verify
+        mock_validation_service.validate_id.assert_called_once_with(1, "Book ID")
+        mock_validation_service.validate_data.assert_called_once()
+        mock_session.flush.assert_called_once()
+        mock_session.refresh.assert_called_once()
+    
+    def test_update_book_not_found(self, book_service, mock_session, query_stub, mock_validation_service):
+        """Test book update when book not found."""
+        # Setup
+        mock_validation_service.validate_id.return_value = 1
+        mock_validation_service.validate_data.return_value = SimpleNamespace(
+            title="Updated Title",
+            author="Updated Author",
+            isbn="9780743273565"
+        )
+        query_stub(mock_session, None)
+        
+        # Execute
+        result = book_service.update_book(1, "Updated Title", "Updated Author", "978-0743273565")
+        
+        # Verify
+        assert result is None
+    
+    def test_delete_book_success(self, book_service, mock_session, query_stub, mock_validation_service, mock_book):
+        """Test successful book deletion."""
+        # Setup
+        mock_validation_service.validate_id.return_value = 1
+        mock_book.title = "Test Book"
+        query_stub(mock_session, mock_book)
+        
+        # Execute
+        result = book_service.delete_book(1)
+        
+        # Verify
+        mock_validation_service.validate_id.assert_called_once_with(1, "Book ID")
+        mock_session.delete.assert_called_once_with(mock_book)
+        mock_session.flush.assert_called_once()
+        assert result is True
+    
+    def test_delete_book_not_found(self, book_service, mock_session, query_stub, mock_validation_service):
+        """Test book deletion when book not found."""
+        # Setup
+        mock_validation_service.validate_id.return_value = 1
+        query_stub(mock_session, None)
+        
+        # Execute
+        result = book_service.delete_book(1)
+        
+        # Verify
+        assert result is False
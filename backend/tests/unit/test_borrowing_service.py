@@ -0,0 +1,84 @@
+"""
+Unit tests for the borrowing service.
+"""
+
+import re
+import pytest
+from types import SimpleNamespace
+
+# Expected error messages, compiled once for pytest.raises(match=...)
+_BOOK_NOT_FOUND = re.compile("Book not found")
+_ALREADY_BORROWED = re.compile("Book is already borrowed")
+_NO_ACTIVE_BORROWING = re.compile("No active borrowing found")
+
+
+class TestBorrowingService:
+    """Test borrowing service functionality."""
+    
+    def test_borrow_book_success(self, borrowing_service, mock_session, query_stub, mock_validation_service, sample_borrowing_data, mock_book, mock_member, mock_borrowing):
+        """Test successful book borrowing."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(book_id=1, member_id=1)
+        
+        # Mock book and member existence
+        query_stub(mock_session, mock_book, mock_member, None)  # book, member, existing borrowing
+        
+        mock_borrowing.id = 1
+        
+        # Execute
+        result = borrowing_service.borrow_book(1, 1)
+        
+        # Verify
+        mock_validation_service.validate_data.assert_called_once()
+        mock_session.add.assert_called_once()
+        mock_session.flush.assert_called_once()
+        mock_session.refresh.assert_called_once()
+    
+    def test_borrow_book_not_found(self, borrowing_service, mock_session, query_stub, mock_validation_service):
+        """Test book borrowing when book not found."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(book_id=1, member_id=1)
+        query_stub(mock_session, None)  # Book not found
+        
+        # Execute & Verify
+        with pytest.raises(ValueError, match=_BOOK_NOT_FOUND):
+            borrowing_service.borrow_book(1, 1)
+    
+    def test_borrow_book_already_borrowed(self, borrowing_service, mock_session, query_stub, mock_validation_service, mock_book, mock_member, mock_borrowing):
+        """Test book borrowing when book is already borrowed."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(book_id=1, member_id=1)
+        
+        # Mock book and member existence, but book already borrowed
+        query_stub(mock_session, mock_book, mock_member, mock_borrowing)
+        
+        # Execute & Verify
+        with pytest.raises(ValueError, match=_ALREADY_BORROWED):
+            borrowing_service.borrow_book(1, 1)
+    
+    def test_return_book_success(self, borrowing_service, mock_session, query_stub, mock_validation_service, mock_borrowing):
+        """Test successful book return."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(book_id=1, member_id=1)
+        
+        mock_borrowing.id = 1
+        query_stub(mock_session, mock_borrowing)
+        
+        # Execute
+        result = borrowing_service.return_book(1, 1)
+        
+        # Verify
+        mock_validation_service.validate_data.assert_called_once()
+        mock_session.flush.assert_called_once()
+        mock_session.refresh.assert_called_once()
+        assert result == mock_borrowing
+    
+    def test_return_book_not_found(self, borrowing_service, mock_session, query_stub, mock_validation_service):
+        """Test book return when borrowing not found."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(book_id=1, member_id=1)
+        query_stub(mock_session, None)
+        
+        # Execute & Verify
+        with pytest.raises(ValueError, match=_NO_ACTIVE_BORROWING):
+            borrowing_service.return_book(1, 1)
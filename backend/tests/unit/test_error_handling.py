@@ -16,7 +16,6 @@ from app.exceptions.library_exceptions import (
     BookAlreadyBorrowedError, BookNotBorrowedError, BookNotAvailableError
 )
 from app.exceptions.grpc_mapping import GRPCStatusMapper
-from app.exceptions.error_handler import ErrorHandler
 
 
 class TestLibraryServiceError:
@@ -110,120 +109,125 @@ class TestValidationError:
 class TestBusinessLogicErrors:
     """Test business logic error classes."""
     
-    def test_resource_not_found_error(self):
-        """Test ResourceNotFoundError."""
-        error = ResourceNotFoundError("Book", 123)
-        
-        assert error.message == "Book with ID 123 not found"
-        assert error.error_code == ErrorCode.RESOURCE_NOT_FOUND
-        assert error.details["resource_type"] == "Book"
-        assert error.details["resource_id"] == 123
-    
-    def test_resource_already_exists_error(self):
-        """Test ResourceAlreadyExistsError."""
-        error = ResourceAlreadyExistsError("Book", "ISBN", "978-1234567890")
-        
-        assert error.message == "Book with ISBN '978-1234567890' already exists"
-        assert error.error_code == ErrorCode.RESOURCE_ALREADY_EXISTS
-        assert error.details["resource_type"] == "Book"
-        assert error.details["identifier"] == "ISBN"
-        assert error.details["value"] == "978-1234567890"
-    
-    def test_conflict_error(self):
-        """Test ConflictError."""
-        error = ConflictError("Resource is locked", "user_123")
-        
-        assert error.message == "Resource is locked"
-        assert error.error_code == ErrorCode.CONFLICT
-        assert error.details["conflicting_resource"] == "user_123"
-    
-    def test_operation_not_allowed_error(self):
-        """Test OperationNotAllowedError."""
-        error = OperationNotAllowedError("delete_book", "Book has active borrowings")
-        
-        assert error.message == "Operation 'delete_book' is not allowed: Book has active borrowings"
-        assert error.error_code == ErrorCode.OPERATION_NOT_ALLOWED
-        assert error.details["operation"] == "delete_book"
-        assert error.details["reason"] == "Book has active borrowings"
+    @pytest.mark.parametrize("exc_factory,expected_message,expected_code,expected_details", [
+        pytest.param(
+            lambda: ResourceNotFoundError("Book", 123),
+            "Book with ID 123 not found",
+            ErrorCode.RESOURCE_NOT_FOUND,
+            {"resource_type": "Book", "resource_id": 123},
+            id="resource-not-found"
+        ),
+        pytest.param(
+            lambda: ResourceAlreadyExistsError("Book", "ISBN", "978-1234567890"),
+            "Book with ISBN '978-1234567890' already exists",
+            ErrorCode.RESOURCE_ALREADY_EXISTS,
+            {"resource_type": "Book", "identifier": "ISBN", "value": "978-1234567890"},
+            id="resource-already-exists"
+        ),
+        pytest.param(
+            lambda: ConflictError("Resource is locked", "user_123"),
+            "Resource is locked",
+            ErrorCode.CONFLICT,
+            {"conflicting_resource": "user_123"},
+            id="conflict"
+        ),
+        pytest.param(
+            lambda: OperationNotAllowedError("delete_book", "Book has active borrowings"),
+            "Operation 'delete_book' is not allowed: Book has active borrowings",
+            ErrorCode.OPERATION_NOT_ALLOWED,
+            {"operation": "delete_book", "reason": "Book has active borrowings"},
+            id="operation-not-allowed"
+        ),
+    ])
+    def test_business_logic_error(self, exc_factory, expected_message, expected_code, expected_details):
+        """Test business logic errors carry their message, code and details."""
+        error = exc_factory()
+        
+        assert error.message == expected_message
+        assert error.error_code == expected_code
+        for key, value in expected_details.items():
+            assert error.details[key] == value
 
 
 class TestLibrarySpecificErrors:
     """Test library-specific error classes."""
     
-    def test_book_not_found_error(self):
-        """Test BookNotFoundError."""
-        error = BookNotFoundError(123)
-        
-        assert error.message == "Book with ID 123 not found"
-        assert error.error_code == ErrorCode.RESOURCE_NOT_FOUND
-        assert error.details["book_id"] == 123
-        assert error.details["resource_type"] == "Book"
-    
-    def test_book_already_exists_error(self):
-        """Test BookAlreadyExistsError."""
-        error = BookAlreadyExistsError("978-1234567890")
-        
-        assert error.message == "Book with ISBN 978-1234567890 already exists"
-        assert error.error_code == ErrorCode.RESOURCE_ALREADY_EXISTS
-        assert error.details["isbn"] == "978-1234567890"
-        assert error.details["resource_type"] == "Book"
-    
-    def test_book_already_borrowed_error(self):
-        """Test BookAlreadyBorrowedError."""
-        error = BookAlreadyBorrowedError(123, 456)
-        
-        assert error.message == "Book with ID 123 is already borrowed by member 456"
-        assert error.error_code == ErrorCode.CONFLICT
-        assert error.details["book_id"] == 123
-        assert error.details["current_borrower_id"] == 456
-        assert error.details["conflict_type"] == "book_already_borrowed"
-    
-    def test_book_not_borrowed_error(self):
-        """Test BookNotBorrowedError."""
-        error = BookNotBorrowedError(123, 456)
-        
-        assert error.message == "Operation 'return_book' is not allowed: Book 123 is not currently borrowed by member 456"
-        assert error.error_code == ErrorCode.OPERATION_NOT_ALLOWED
-        assert error.details["book_id"] == 123
-        assert error.details["member_id"] == 456
-        assert error.details["operation"] == "return_book"
+    @pytest.mark.parametrize("exc_factory,expected_message,expected_code,expected_details", [
+        pytest.param(
+            lambda: BookNotFoundError(123),
+            "Book with ID 123 not found",
+            ErrorCode.RESOURCE_NOT_FOUND,
+            {"book_id": 123, "resource_type": "Book"},
+            id="book-not-found"
+        ),
+        pytest.param(
+            lambda: BookAlreadyExistsError("978-1234567890"),
+            "Book with ISBN 978-1234567890 already exists",
+            ErrorCode.RESOURCE_ALREADY_EXISTS,
+            {"isbn": "978-1234567890", "resource_type": "Book"},
+            id="book-already-exists"
+        ),
+        pytest.param(
+            lambda: BookAlreadyBorrowedError(123, 456),
+            "Book with ID 123 is already borrowed by member 456",
+            ErrorCode.CONFLICT,
+            {"book_id": 123, "current_borrower_id": 456, "conflict_type": "book_already_borrowed"},
+            id="book-already-borrowed"
+        ),
+        pytest.param(
+            lambda: BookNotBorrowedError(123, 456),
+            "Operation 'return_book' is not allowed: Book 123 is not currently borrowed by member 456",
+            ErrorCode.OPERATION_NOT_ALLOWED,
+            {"book_id": 123, "member_id": 456, "operation": "return_book"},
+            id="book-not-borrowed"
+        ),
+    ])
+    def test_library_error(self, exc_factory, expected_message, expected_code, expected_details):
+        """Test library-specific errors carry their message, code and details."""
+        error = exc_factory()
+        
+        assert error.message == expected_message
+        assert error.error_code == expected_code
+        for key, value in expected_details.items():
+            assert error.details[key] == value
 
 
 class TestGRPCStatusMapper:
     """Test gRPC status code mapping."""
     
-    def test_validation_error_mapping(self):
-        """Test mapping of validation errors to gRPC status codes."""
-        error = ValidationError("Invalid format", "email")
-        grpc_status, details = GRPCStatusMapper.map_exception_to_grpc_status(error)
-        
-        assert grpc_status == grpc.StatusCode.INVALID_ARGUMENT
-        assert "Invalid format" in details
-        assert "Field: email" in details
-    
-    def test_resource_not_found_mapping(self):
-        """Test mapping of resource not found errors."""
-        error = BookNotFoundError(123)
-        grpc_status, details = GRPCStatusMapper.map_exception_to_grpc_status(error)
-        
-        assert grpc_status == grpc.StatusCode.NOT_FOUND
-        assert "Book with ID 123 not found" in details
-    
-    def test_conflict_mapping(self):
-        """Test mapping of conflict errors."""
-        error = BookAlreadyBorrowedError(123, 456)
-        grpc_status, details = GRPCStatusMapper.map_exception_to_grpc_status(error)
-        
-        assert grpc_status == grpc.StatusCode.ABORTED
-        assert "Book with ID 123 is already borrowed" in details
-    
-    def test_database_error_mapping(self):
-        """Test mapping of database errors."""
-        error = DatabaseError("Connection failed", "create_book")
-        grpc_status, details = GRPCStatusMapper.map_exception_to_grpc_status(error)
-        
-        assert grpc_status == grpc.StatusCode.INTERNAL
-        assert "Connection failed" in details
+    @pytest.mark.parametrize("exc_factory,expected_status,expected_substrings", [
+        pytest.param(
+            lambda: ValidationError("Invalid format", "email"),
+            grpc.StatusCode.INVALID_ARGUMENT,
+            ("Invalid format", "Field: email"),
+            id="validation"
+        ),
+        pytest.param(
+            lambda: BookNotFoundError(123),
+            grpc.StatusCode.NOT_FOUND,
+            ("Book with ID 123 not found",),
+            id="resource-not-found"
+        ),
+        pytest.param(
+            lambda: BookAlreadyBorrowedError(123, 456),
+            grpc.StatusCode.ABORTED,
+            ("Book with ID 123 is already borrowed",),
+            id="conflict"
+        ),
+        pytest.param(
+            lambda: DatabaseError("Connection failed", "create_book"),
+            grpc.StatusCode.INTERNAL,
+            ("Connection failed",),
+            id="database"
+        ),
+    ])
+    def test_exception_mapping(self, exc_factory, expected_status, expected_substrings):
+        """Test mapping of library errors to gRPC status codes and details."""
+        grpc_status, details = GRPCStatusMapper.map_exception_to_grpc_status(exc_factory())
+        
+        assert grpc_status == expected_status
+        for substring in expected_substrings:
+            assert substring in details
     
     def test_generic_exception_mapping(self):
         """Test mapping of generic exceptions."""
@@ -262,12 +266,11 @@ class TestGRPCStatusMapper:
 class TestErrorHandler:
     """Test ErrorHandler class."""
     
-    def test_handle_library_service_error(self):
+    def test_handle_library_service_error(self, error_handler):
         """Test handling of LibraryServiceError."""
-        handler = ErrorHandler("test_handler")
         error = ValidationError("Invalid format", "email")
         
-        transformed_error, log_data = handler.handle_exception(
+        transformed_error, log_data = error_handler.handle_exception(
             error,
             context={"test": "data"},
             operation="test_operation"
@@ -279,12 +282,11 @@ class TestErrorHandler:
         assert log_data["error_code"] == "INVALID_FORMAT"
         assert log_data["error_category"] == "validation"
     
-    def test_handle_generic_exception(self):
+    def test_handle_generic_exception(self, error_handler):
         """Test handling of generic exceptions."""
-        handler = ErrorHandler("test_handler")
         error = ValueError("Test error")
         
-        transformed_error, log_data = handler.handle_exception(
+        transformed_error, log_data = error_handler.handle_exception(
             error,
             context={"test": "data"},
             operation="test_operation"
@@ -295,12 +297,11 @@ class TestErrorHandler:
         assert log_data["error_code"] == "INTERNAL_ERROR"
         assert log_data["error_category"] == "system"
     
-    def test_handle_grpc_exception(self):
+    def test_handle_grpc_exception(self, error_handler):
         """Test handling of gRPC exceptions."""
-        handler = ErrorHandler("test_handler")
         error = BookNotFoundError(123)
         
-        transformed_error, grpc_status, details = handler.handle_grpc_exception(
+        transformed_error, grpc_status, details = error_handler.handle_grpc_exception(
             error,
             context={"book_id": 123},
             operation="GetBook"
@@ -310,12 +311,11 @@ class TestErrorHandler:
         assert grpc_status == grpc.StatusCode.NOT_FOUND
         assert "Book with ID 123 not found" in details
     
-    def test_handle_rest_exception(self):
+    def test_handle_rest_exception(self, error_handler):
         """Test handling of REST exceptions."""
-        handler = ErrorHandler("test_handler")
         error = ValidationError("Invalid format", "email")
         
-        transformed_error, http_status, response = handler.handle_rest_exception(
+        transformed_error, http_status, response = error_handler.handle_rest_exception(
             error,
             context={"email": "invalid"},
             operation="create_member"
@@ -327,24 +327,22 @@ class TestErrorHandler:
         assert response["message"] == "Invalid format"
         assert response["status_code"] == 400
     
-    def test_error_handler_context_manager(self):
+    def test_error_handler_context_manager(self, error_handler):
         """Test error handler context manager."""
-        handler = ErrorHandler("test_handler")
-        
-        with handler.handle_errors("test_operation", {"test": "data"}) as h:
+        with error_handler.handle_errors("test_operation", {"test": "data"}) as h:
             # Should not raise an exception
             pass
         
         # Test with exception
         with pytest.raises(ValueError):
-            with handler.handle_errors("test_operation", {"test": "data"}) as h:
+            with error_handler.handle_errors("test_operation", {"test": "data"}) as h:
                 raise ValueError("Test error")
 
 
 class TestErrorHandlingIntegration:
     """Test error handling integration scenarios."""
     
-    def test_validation_error_flow(self):
+    def test_validation_error_flow(self, error_handler):
         """Test complete validation error flow."""
         # Create validation error
         error = ValidationError("Invalid email format", "email", "invalid-email")
@@ -355,12 +353,18 @@ class TestErrorHandlingIntegration:
         assert "Invalid email format" in grpc_details
         
         # Map to REST
-        handler = ErrorHandler("test_handler")
-        _, http_status, response = handler.handle_rest_exception(error, operation="create_member")
+        _, http_status, response = error_handler.handle_rest_exception(error, operation="create_member")
         assert http_status == 400
-        assert response["error_code"] == "INVALID_FORMAT"
+        assert response == {
+            "error": "ValidationError",
+            "message": "Invalid email format",
+            "error_code": "INVALID_FORMAT",
+            "details": {"value": "invalid-email"},
+            "field": "email",
+            "status_code": 400
+        }
     
-    def test_business_logic_error_flow(self):
+    def test_business_logic_error_flow(self, error_handler):
         """Test complete business logic error flow."""
         # Create business logic error
         error = BookNotFoundError(123)
@@ -371,12 +375,17 @@ class TestErrorHandlingIntegration:
         assert "Book with ID 123 not found" in grpc_details
         
         # Map to REST
-        handler = ErrorHandler("test_handler")
-        _, http_status, response = handler.handle_rest_exception(error, operation="get_book")
+        _, http_status, response = error_handler.handle_rest_exception(error, operation="get_book")
         assert http_status == 404
-        assert response["error_code"] == "RESOURCE_NOT_FOUND"
+        assert response == {
+            "error": "BookNotFoundError",
+            "message": "Book with ID 123 not found",
+            "error_code": "RESOURCE_NOT_FOUND",
+            "details": {"book_id": 123, "resource_type": "Book"},
+            "status_code": 404
+        }
     
-    def test_database_error_flow(self):
+    def test_database_error_flow(self, error_handler):
         """Test complete database error flow."""
         # Create database error
         error = DatabaseError("Connection failed", "create_book")
@@ -387,7 +396,12 @@ class TestErrorHandlingIntegration:
         assert "Connection failed" in grpc_details
         
         # Map to REST
-        handler = ErrorHandler("test_handler")
-        _, http_status, response = handler.handle_rest_exception(error, operation="create_book")
+        _, http_status, response = error_handler.handle_rest_exception(error, operation="create_book")
         assert http_status == 500
-        assert response["error_code"] == "DATABASE_ERROR"
+        assert response == {
+            "error": "DatabaseError",
+            "message": "Connection failed",
+            "error_code": "DATABASE_ERROR",
+            "details": {"operation": "create_book"},
+            "status_code": 500
+        }
@@ -0,0 +1,45 @@
+"""
+Unit tests for the member service.
+"""
+
+from types import SimpleNamespace
+
+from app.models.member import Member
+
+
+class TestMemberService:
+    """Test member service functionality."""
+    
+    def test_create_member_success(self, member_service, mock_session, mock_validation_service, sample_member_data, mock_member):
+        """Test successful member creation."""
+        # Setup
+        mock_validation_service.validate_data.return_value = SimpleNamespace(
+            name="John Doe",
+            email="john.doe@example.com",
+            phone="+15551234567"
+        )
+        mock_member.id = 1
+        
+        # Execute
+        result = member_service.create_member("John Doe", "john.doe@example.com", "+1-555-123-4567")
+        
+        # Verify
+        mock_validation_service.validate_data.assert_called_once()
+        mock_session.add.assert_called_once()
+        mock_session.flush.assert_called_once()
+        mock_session.refresh.assert_called_once()
+    
+    def test_get_member_success(self, member_service, mock_session, query_stub, mock_validation_service, mock_member):
+        """Test successful member retrieval."""
+        # Setup
+        mock_validation_service.validate_id.return_value = 1
+        mock_member.name = "John Doe"
+        query_stub(mock_session, mock_member)
+        
+        # Execute
+        result = member_service.get_member(1)
+        
+        # Verify
+        mock_validation_service.validate_id.assert_called_once_with(1, "Member ID")
+        mock_session.query.assert_called_once_with(Member)
+        assert result == mock_member
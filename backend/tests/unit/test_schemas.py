@@ -3,24 +3,43 @@ Unit tests for Pydantic schemas.
 """
 
 import pytest
+from types import MappingProxyType
 from pydantic import ValidationError as PydanticValidationError
 
 from app.schemas.book_schemas import BookCreateSchema, BookUpdateSchema, BookResponseSchema
 from app.schemas.member_schemas import MemberCreateSchema, MemberUpdateSchema, MemberResponseSchema
 from app.schemas.borrowing_schemas import BorrowingCreateSchema, BorrowingReturnSchema, BorrowingResponseSchema
 
+# Read-only valid payloads; tests unpack them, overriding fields as needed
+_VALID_BOOK = MappingProxyType({
+    "title": "The Great Gatsby",
+    "author": "F. Scott Fitzgerald",
+    "isbn": "978-0743273565"
+})
+
+_VALID_MEMBER = MappingProxyType({
+    "name": "John Doe",
+    "email": "john.doe@example.com",
+    "phone": "+1-555-123-4567"
+})
+
+_VALID_BORROWING = MappingProxyType({
+    "book_id": 1,
+    "member_id": 1
+})
+
+
+def _errors_by_field(exc_info):
+    """Index a Pydantic validation error's structured errors by field name."""
+    return {error["loc"][0]: error for error in exc_info.value.errors()}
+
 
 class TestBookSchemas:
     """Test book validation schemas."""
     
     def test_valid_book_create(self):
         """Test valid book creation schema."""
-        data = {
-            "title": "The Great Gatsby",
-            "author": "F. Scott Fitzgerald",
-            "isbn": "978-0743273565"
-        }
-        book = BookCreateSchema(**data)
+        book = BookCreateSchema(**_VALID_BOOK)
         assert book.title == "The Great Gatsby"
         assert book.author == "F. Scott Fitzgerald"
         assert book.isbn == "9780743273565"  # Should be cleaned
@@ -44,7 +63,7 @@ class TestBookSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             BookCreateSchema(**data)
-        assert "String should have at least 1 character" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["title"]["type"] == "string_too_short"
     
     def test_book_create_missing_author(self):
         """Test book creation with missing author."""
@@ -53,7 +72,7 @@ class TestBookSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             BookCreateSchema(**data)
-        assert "Field required" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["author"]["type"] == "missing"
     
     def test_book_create_invalid_isbn(self):
         """Test book creation with invalid ISBN."""
@@ -64,7 +83,7 @@ class TestBookSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             BookCreateSchema(**data)
-        assert "ISBN-10 must contain only digits" in str(exc_info.value)
+        assert "ISBN-10 must contain only digits" in _errors_by_field(exc_info)["isbn"]["msg"]
     
     def test_valid_book_update(self):
         """Test valid book update schema."""
@@ -118,12 +137,7 @@ class TestMemberSchemas:
     
     def test_valid_member_create(self):
         """Test valid member creation schema."""
-        data = {
-            "name": "John Doe",
-            "email": "john.doe@example.com",
-            "phone": "+1-555-123-4567"
-        }
-        member = MemberCreateSchema(**data)
+        member = MemberCreateSchema(**_VALID_MEMBER)
         assert member.name == "John Doe"
         assert member.email == "john.doe@example.com"
         assert member.phone == "+15551234567"  # Should be cleaned
@@ -147,7 +161,7 @@ class TestMemberSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             MemberCreateSchema(**data)
-        assert "Invalid email address" in str(exc_info.value)
+        assert "Invalid email address" in _errors_by_field(exc_info)["email"]["msg"]
     
     def test_member_create_empty_name(self):
         """Test member creation with empty name."""
@@ -157,7 +171,7 @@ class TestMemberSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             MemberCreateSchema(**data)
-        assert "String should have at least 1 character" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["name"]["type"] == "string_too_short"
     
     def test_member_create_missing_email(self):
         """Test member creation with missing email."""
@@ -166,7 +180,7 @@ class TestMemberSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             MemberCreateSchema(**data)
-        assert "Field required" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["email"]["type"] == "missing"
     
     def test_member_create_invalid_phone(self):
         """Test member creation with invalid phone."""
@@ -177,7 +191,7 @@ class TestMemberSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             MemberCreateSchema(**data)
-        assert "Phone number must be 7-15 digits" in str(exc_info.value)
+        assert "Phone number must be 7-15 digits" in _errors_by_field(exc_info)["phone"]["msg"]
     
     def test_valid_member_update(self):
         """Test valid member update schema."""
@@ -223,33 +237,23 @@ class TestBorrowingSchemas:
     
     def test_valid_borrowing_create(self):
         """Test valid borrowing creation schema."""
-        data = {
-            "book_id": 1,
-            "member_id": 1
-        }
-        borrowing = BorrowingCreateSchema(**data)
+        borrowing = BorrowingCreateSchema(**_VALID_BORROWING)
         assert borrowing.book_id == 1
         assert borrowing.member_id == 1
     
     def test_borrowing_create_invalid_book_id(self):
         """Test borrowing creation with invalid book ID."""
-        data = {
-            "book_id": 0,  # Must be positive
-            "member_id": 1
-        }
+        data = {**_VALID_BORROWING, "book_id": 0}  # Must be positive
         with pytest.raises(PydanticValidationError) as exc_info:
             BorrowingCreateSchema(**data)
-        assert "Input should be greater than 0" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["book_id"]["type"] == "greater_than"
     
     def test_borrowing_create_invalid_member_id(self):
         """Test borrowing creation with invalid member ID."""
-        data = {
-            "book_id": 1,
-            "member_id": -1  # Must be positive
-        }
+        data = {**_VALID_BORROWING, "member_id": -1}  # Must be positive
         with pytest.raises(PydanticValidationError) as exc_info:
             BorrowingCreateSchema(**data)
-        assert "Input should be greater than 0" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["member_id"]["type"] == "greater_than"
     
     def test_borrowing_create_missing_book_id(self):
         """Test borrowing creation with missing book ID."""
@@ -258,7 +262,7 @@ class TestBorrowingSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             BorrowingCreateSchema(**data)
-        assert "Field required" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["book_id"]["type"] == "missing"
     
     def test_borrowing_create_missing_member_id(self):
         """Test borrowing creation with missing member ID."""
@@ -267,15 +271,11 @@ class TestBorrowingSchemas:
         }
         with pytest.raises(PydanticValidationError) as exc_info:
             BorrowingCreateSchema(**data)
-        assert "Field required" in str(exc_info.value)
+        assert _errors_by_field(exc_info)["member_id"]["type"] == "missing"
     
     def test_valid_borrowing_return(self):
         """Test valid borrowing return schema."""
-        data = {
-            "book_id": 1,
-            "member_id": 1
-        }
-        borrowing = BorrowingReturnSchema(**data)
+        borrowing = BorrowingReturnSchema(**_VALID_BORROWING)
         assert borrowing.book_id == 1
         assert borrowing.member_id == 1
     
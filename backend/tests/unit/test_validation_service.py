@@ -0,0 +1,85 @@
+"""
+Unit tests for the validation service and service-level validation.
+"""
+
+import pytest
+
+from app.utils.validators import ValidationError
+from app.schemas.book_schemas import BookCreateSchema
+
+
+class TestServiceValidationErrors:
+    """Test that services propagate input validation failures."""
+    
+    @pytest.mark.parametrize("service_fixture,method,args,error", [
+        pytest.param(
+            "book_service", "create_book", ("", "Author", "isbn"),
+            ValidationError("Invalid data", "title", ""),
+            id="create_book"
+        ),
+        pytest.param(
+            "member_service", "create_member", ("John Doe", "invalid-email", "+1-555-123-4567"),
+            ValidationError("Invalid email", "email", "invalid"),
+            id="create_member"
+        ),
+        pytest.param(
+            "borrowing_service", "borrow_book", (0, 1),
+            ValidationError("Invalid ID", "book_id", 0),
+            id="borrow_book"
+        ),
+    ])
+    def test_validation_error(self, request, mock_validation_service, service_fixture, method, args, error):
+        """Test service call with validation error."""
+        # Setup
+        mock_validation_service.validate_data.side_effect = error
+        service = request.getfixturevalue(service_fixture)
+        
+        # Execute & Verify
+        with pytest.raises(ValidationError):
+            getattr(service, method)(*args)
+
+
+class TestValidationService:
+    """Test validation service functionality."""
+    
+    def test_validate_data_success(self, validation_service, sample_book_data):
+        """Test successful data validation."""
+        result = validation_service.validate_data(sample_book_data, BookCreateSchema)
+        
+        assert result.title == sample_book_data["title"]
+        assert result.author == sample_book_data["author"]
+        assert result.isbn == "9780743273565"  # Cleaned ISBN
+    
+    def test_validate_data_validation_error(self, validation_service, invalid_book_data):
+        """Test data validation with validation error."""
+        with pytest.raises(ValidationError):
+            validation_service.validate_data(invalid_book_data, BookCreateSchema)
+    
+    def test_compiled_validator(self, validation_service, sample_book_data):
+        """Test validator bound to a schema with compile."""
+        validator = validation_service.compile(BookCreateSchema)
+        result = validator(sample_book_data, context={"operation": "create_book"})
+        
+        assert result.title == sample_book_data["title"]
+        assert result.isbn == "9780743273565"  # Cleaned ISBN
+    
+    def test_validate_id_success(self, validation_service):
+        """Test successful ID validation."""
+        result = validation_service.validate_id(42, "Test ID")
+        assert result == 42
+    
+    def test_validate_id_invalid(self, validation_service):
+        """Test ID validation with invalid ID."""
+        with pytest.raises(ValidationError):
+            validation_service.validate_id(0, "Test ID")
+    
+    def test_create_validation_error_response(self, validation_service):
+        """Test validation error response creation."""
+        error = ValidationError("Test error", "test_field", "test_value")
+        response = validation_service.create_validation_error_response(error, 400)
+        
+        assert response["error"] == "Validation Error"
+        assert response["message"] == "Test error"
+        assert response["field"] == "test_field"
+        assert response["value"] == "test_value"
+        assert response["status_code"] == 400
@@ -13,208 +13,106 @@ from app.utils.validators import (
 class TestISBNValidation:
     """Test ISBN validation functionality."""
     
-    def test_valid_isbn_10(self):
-        """Test valid ISBN-10."""
-        result = validate_isbn("0-7475-3269-9")
-        assert result == "0747532699"
-    
-    def test_valid_isbn_13(self):
-        """Test valid ISBN-13."""
-        result = validate_isbn("978-0-7475-3269-9")
-        assert result == "9780747532699"
-    
-    def test_isbn_with_spaces(self):
-        """Test ISBN with spaces."""
-        result = validate_isbn("978 0 7475 3269 9")
-        assert result == "9780747532699"
-    
-    def test_isbn_10_with_x(self):
-        """Test ISBN-10 ending with X."""
-        result = validate_isbn("0-201-63361-X")
-        assert result == "020163361X"
-    
-    def test_invalid_isbn_10_check_digit(self):
-        """Test invalid ISBN-10 check digit."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_isbn("0-7475-3269-0")
-        assert "Invalid ISBN-10 check digit" in str(exc_info.value)
+    @pytest.mark.parametrize("raw,expected", [
+        pytest.param("0-7475-3269-9", "0747532699", id="isbn_10"),
+        pytest.param("978-0-7475-3269-9", "9780747532699", id="isbn_13"),
+        pytest.param("978 0 7475 3269 9", "9780747532699", id="spaces"),
+        pytest.param("0-201-63361-X", "020163361X", id="isbn_10_with_x"),
+        pytest.param("", "", id="empty"),
+        pytest.param(None, None, id="none"),
+    ])
+    def test_isbn_ok(self, raw, expected):
+        """Test ISBNs that are accepted and normalized."""
+        assert validate_isbn(raw) == expected
+    
+    @pytest.mark.parametrize("raw,msg", [
+        pytest.param("0-7475-3269-0", "Invalid ISBN-10 check digit", id="isbn_10_check_digit"),
+        pytest.param("978-0-7475-3269-0", "Invalid ISBN-13 check digit", id="isbn_13_check_digit"),
+        pytest.param("123456789", "ISBN must be 10 or 13 digits long", id="length"),
+        pytest.param("978-0-7475-3269-A", "ISBN-13 must contain only digits", id="characters"),
+    ])
+    def test_isbn_err(self, raw, msg):
+        """Test ISBNs that are rejected."""
+        with pytest.raises(ValidationError, match=msg) as exc_info:
+            validate_isbn(raw)
         assert exc_info.value.field == "isbn"
-    
-    def test_invalid_isbn_13_check_digit(self):
-        """Test invalid ISBN-13 check digit."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_isbn("978-0-7475-3269-0")
-        assert "Invalid ISBN-13 check digit" in str(exc_info.value)
-        assert exc_info.value.field == "isbn"
-    
-    def test_invalid_isbn_length(self):
-        """Test invalid ISBN length."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_isbn("123456789")
-        assert "ISBN must be 10 or 13 digits long" in str(exc_info.value)
-        assert exc_info.value.field == "isbn"
-    
-    def test_invalid_isbn_characters(self):
-        """Test invalid ISBN characters."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_isbn("978-0-7475-3269-A")
-        assert "ISBN-13 must contain only digits" in str(exc_info.value)
-        assert exc_info.value.field == "isbn"
-    
-    def test_empty_isbn(self):
-        """Test empty ISBN."""
-        result = validate_isbn("")
-        assert result == ""
-    
-    def test_none_isbn(self):
-        """Test None ISBN."""
-        result = validate_isbn(None)
-        assert result is None
 
 
 class TestPhoneValidation:
     """Test phone number validation functionality."""
     
-    def test_valid_local_phone(self):
-        """Test valid local phone number."""
-        result = validate_phone("555-123-4567")
-        assert result == "5551234567"
-    
-    def test_valid_international_phone(self):
-        """Test valid international phone number."""
-        result = validate_phone("+1-555-123-4567")
-        assert result == "+15551234567"
-    
-    def test_phone_with_spaces(self):
-        """Test phone number with spaces."""
-        result = validate_phone("+1 555 123 4567")
-        assert result == "+15551234567"
-    
-    def test_phone_with_dots(self):
-        """Test phone number with dots."""
-        result = validate_phone("555.123.4567")
-        assert result == "5551234567"
-    
-    def test_invalid_local_phone_too_short(self):
-        """Test invalid local phone number (too short)."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_phone("123")
-        assert "Phone number must be 7-15 digits" in str(exc_info.value)
-        assert exc_info.value.field == "phone"
-    
-    def test_invalid_international_phone_too_short(self):
-        """Test invalid international phone number (too short)."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_phone("+123")
-        assert "International phone number must be 8-16 digits" in str(exc_info.value)
-        assert exc_info.value.field == "phone"
-    
-    def test_invalid_international_phone_too_long(self):
-        """Test invalid international phone number (too long)."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_phone("+12345678901234567")
-        assert "International phone number must be 8-16 digits" in str(exc_info.value)
+    @pytest.mark.parametrize("raw,expected", [
+        pytest.param("555-123-4567", "5551234567", id="local"),
+        pytest.param("+1-555-123-4567", "+15551234567", id="international"),
+        pytest.param("+1 555 123 4567", "+15551234567", id="spaces"),
+        pytest.param("555.123.4567", "5551234567", id="dots"),
+        pytest.param("0978\u00b26838", "09786838", id="superscript_digit"),
+        pytest.param("", "", id="empty"),
+        pytest.param(None, None, id="none"),
+    ])
+    def test_phone_ok(self, raw, expected):
+        """Test phone numbers that are accepted and normalized."""
+        assert validate_phone(raw) == expected
+    
+    @pytest.mark.parametrize("raw,msg", [
+        pytest.param("123", "Phone number must be 7-15 digits", id="local_too_short"),
+        pytest.param("+123", "International phone number must be 8-16 digits", id="international_too_short"),
+        pytest.param("+12345678901234567", "International phone number must be 8-16 digits", id="international_too_long"),
+    ])
+    def test_phone_err(self, raw, msg):
+        """Test phone numbers that are rejected."""
+        with pytest.raises(ValidationError, match=msg) as exc_info:
+            validate_phone(raw)
         assert exc_info.value.field == "phone"
-    
-    def test_empty_phone(self):
-        """Test empty phone number."""
-        result = validate_phone("")
-        assert result == ""
-    
-    def test_none_phone(self):
-        """Test None phone number."""
-        result = validate_phone(None)
-        assert result is None
 
 
 class TestEmailValidation:
     """Test email validation functionality."""
     
-    def test_valid_email(self):
-        """Test valid email address."""
-        result = validate_email_address("user@example.com")
-        assert result == "user@example.com"
-    
-    def test_valid_email_with_subdomain(self):
-        """Test valid email with subdomain."""
-        result = validate_email_address("user@mail.example.com")
-        assert result == "user@mail.example.com"
-    
-    def test_invalid_email_no_at(self):
-        """Test invalid email without @."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_email_address("userexample.com")
-        assert "Invalid email address" in str(exc_info.value)
-        assert exc_info.value.field == "email"
-    
-    def test_invalid_email_no_domain(self):
-        """Test invalid email without domain."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_email_address("user@")
-        assert "Invalid email address" in str(exc_info.value)
-        assert exc_info.value.field == "email"
-    
-    def test_empty_email(self):
-        """Test empty email address."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_email_address("")
-        assert "Email address is required" in str(exc_info.value)
-        assert exc_info.value.field == "email"
-    
-    def test_none_email(self):
-        """Test None email address."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_email_address(None)
-        assert "Email address is required" in str(exc_info.value)
+    @pytest.mark.parametrize("raw", [
+        pytest.param("user@example.com", id="plain"),
+        pytest.param("user@mail.example.com", id="subdomain"),
+    ])
+    def test_email_ok(self, raw):
+        """Test email addresses that are accepted."""
+        assert validate_email_address(raw) == raw
+    
+    @pytest.mark.parametrize("raw,msg", [
+        pytest.param("userexample.com", "Invalid email address", id="no_at"),
+        pytest.param("user@", "Invalid email address", id="no_domain"),
+        pytest.param("", "Email address is required", id="empty"),
+        pytest.param(None, "Email address is required", id="none"),
+    ])
+    def test_email_err(self, raw, msg):
+        """Test email addresses that are rejected."""
+        with pytest.raises(ValidationError, match=msg) as exc_info:
+            validate_email_address(raw)
         assert exc_info.value.field == "email"
 
 
 class TestRequiredStringValidation:
     """Test required string validation functionality."""
     
-    def test_valid_string(self):
-        """Test valid string."""
-        result = validate_required_string("Hello World", "test_field")
-        assert result == "Hello World"
-    
-    def test_string_with_whitespace(self):
-        """Test string with whitespace (should be trimmed)."""
-        result = validate_required_string("  Hello World  ", "test_field")
-        assert result == "Hello World"
-    
-    def test_empty_string(self):
-        """Test empty string."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_required_string("", "test_field")
-        assert "test_field is required and cannot be empty" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_whitespace_only_string(self):
-        """Test whitespace-only string."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_required_string("   ", "test_field")
-        assert "test_field is required and cannot be empty" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_none_string(self):
-        """Test None string."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_required_string(None, "test_field")
-        assert "test_field is required and cannot be empty" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_string_too_short(self):
-        """Test string too short."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_required_string("Hi", "test_field", min_length=5)
-        assert "test_field must be at least 5 characters long" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_string_too_long(self):
-        """Test string too long."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_required_string("A" * 300, "test_field", max_length=255)
-        assert "test_field must be no more than 255 characters long" in str(exc_info.value)
+    @pytest.mark.parametrize("raw,expected", [
+        pytest.param("Hello World", "Hello World", id="plain"),
+        pytest.param("  Hello World  ", "Hello World", id="trimmed"),
+    ])
+    def test_string_ok(self, raw, expected):
+        """Test strings that are accepted and trimmed."""
+        assert validate_required_string(raw, "test_field") == expected
+    
+    @pytest.mark.parametrize("raw,kwargs,msg", [
+        pytest.param("", {}, "test_field is required and cannot be empty", id="empty"),
+        pytest.param("   ", {}, "test_field is required and cannot be empty", id="whitespace_only"),
+        pytest.param(None, {}, "test_field is required and cannot be empty", id="none"),
+        pytest.param([], {}, "test_field is required and cannot be empty", id="empty_list"),
+        pytest.param("Hi", {"min_length": 5}, "test_field must be at least 5 characters long", id="too_short"),
+        pytest.param("A" * 300, {"max_length": 255}, "test_field must be no more than 255 characters long", id="too_long"),
+    ])
+    def test_string_err(self, raw, kwargs, msg):
+        """Test strings that are rejected."""
+        with pytest.raises(ValidationError, match=msg) as exc_info:
+            validate_required_string(raw, "test_field", **kwargs)
         assert exc_info.value.field == "test_field"
 
 
@@ -223,40 +121,17 @@ class TestPositiveIntegerValidation:
     
     def test_valid_positive_integer(self):
         """Test valid positive integer."""
-        result = validate_positive_integer(42, "test_field")
-        assert result == 42
-    
-    def test_zero_integer(self):
-        """Test zero integer."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer(0, "test_field")
-        assert "test_field must be a positive integer" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_negative_integer(self):
-        """Test negative integer."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer(-1, "test_field")
-        assert "test_field must be a positive integer" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_string_integer(self):
-        """Test string that looks like integer."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer("42", "test_field")
-        assert "test_field must be an integer" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_float_integer(self):
-        """Test float."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer(42.5, "test_field")
-        assert "test_field must be an integer" in str(exc_info.value)
-        assert exc_info.value.field == "test_field"
-    
-    def test_none_integer(self):
-        """Test None."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer(None, "test_field")
-        assert "test_field must be an integer" in str(exc_info.value)
+        assert validate_positive_integer(42, "test_field") == 42
+    
+    @pytest.mark.parametrize("raw,msg", [
+        pytest.param(0, "test_field must be a positive integer", id="zero"),
+        pytest.param(-1, "test_field must be a positive integer", id="negative"),
+        pytest.param("42", "test_field must be an integer", id="string"),
+        pytest.param(42.5, "test_field must be an integer", id="float"),
+        pytest.param(None, "test_field must be an integer", id="none"),
+    ])
+    def test_integer_err(self, raw, msg):
+        """Test values that are rejected."""
+        with pytest.raises(ValidationError, match=msg) as exc_info:
+            validate_positive_integer(raw, "test_field")
         assert exc_info.value.field == "test_field"